@@ -67,6 +67,14 @@ def is_entrance_clarification_message(text):
 
 st.set_page_config(page_title="Cook Strait Navigator", page_icon="⚓", layout="wide")
 
+@st.cache_resource
+def start_weather_prewarm():
+    # Streamlit reruns this script per interaction; cache_resource starts the thread once
+    return nav.start_weather_prewarm()
+
+if nav.get_secret("WEATHER_PREWARM"):
+    start_weather_prewarm()
+
 # --- SIDEBAR (Restored Layout) ---
 with st.sidebar:
     st.title("🚢 Vessel Profile")
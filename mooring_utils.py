@@ -8,6 +8,26 @@ import math
 from typing import List, Tuple, Optional
 from datetime import datetime, timedelta
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Patterns compiled once at import (used per query)
+_COORDINATE_PATTERN = re.compile(r'-?\d+\.\d+,?\s*\d+\.\d+')
+_TRIP_DAYS_PATTERN = re.compile(r'(\d+)\s*(day|night)', re.IGNORECASE)
+_WEEKEND_PATTERN = re.compile(r'weekend', re.IGNORECASE)
+_OVERNIGHT_PATTERN = re.compile(r'overnight|one night', re.IGNORECASE)
+_WEEK_PATTERN = re.compile(r'week', re.IGNORECASE)
+
 
 def extract_location_coordinates(text: str) -> Optional[Tuple[float, float]]:
     """
@@ -16,8 +36,7 @@ def extract_location_coordinates(text: str) -> Optional[Tuple[float, float]]:
     Returns: (latitude, longitude) tuple or None
     """
     # Pattern for coordinates: -41.1234, 174.5678
-    pattern = r'-?\d+\.\d+,?\s*\d+\.\d+'
-    match = re.search(pattern, text)
+    match = _COORDINATE_PATTERN.search(text)
     
     if match:
         coord_str = match.group(0).replace(' ', '')
@@ -48,6 +67,50 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return R * c
 
 
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _haversine_kernel(lat0, lon0, lats, lons, out):
+        """Compiled haversine_batch loop; fills and returns out (nautical miles)."""
+        R = 3440.065  # Earth radius in nautical miles
+        lat0_rad = math.radians(lat0)
+        cos_lat0 = math.cos(lat0_rad)
+        for i in prange(lats.shape[0]):
+            lat_rad = math.radians(lats[i])
+            delta_lat = lat_rad - lat0_rad
+            delta_lon = math.radians(lons[i] - lon0)
+            a = math.sin(delta_lat / 2) ** 2 + cos_lat0 * math.cos(lat_rad) * math.sin(delta_lon / 2) ** 2
+            out[i] = 2 * R * math.asin(math.sqrt(a))
+        return out
+
+
+def haversine_batch(lat0: float, lon0: float, lats, lons) -> List[float]:
+    """
+    Distance from (lat0, lon0) to each (lats[i], lons[i]) in nautical miles.
+    Uses a compiled Numba kernel when available, then NumPy, then a loop
+    over haversine_distance.
+    """
+    if not NUMPY_AVAILABLE:
+        return [haversine_distance(lat0, lon0, lat, lon) for lat, lon in zip(lats, lons)]
+    
+    if NUMBA_AVAILABLE:
+        lats = np.ascontiguousarray(lats, dtype=np.float64)
+        lons = np.ascontiguousarray(lons, dtype=np.float64)
+        out = np.empty(lats.shape[0], dtype=np.float64)
+        return _haversine_kernel(float(lat0), float(lon0), lats, lons, out).tolist()
+    
+    R = 3440.065  # Earth radius in nautical miles
+    
+    lat0_rad = np.radians(lat0)
+    lats_rad = np.radians(np.asarray(lats, dtype=float))
+    delta_lat = lats_rad - lat0_rad
+    delta_lon = np.radians(np.asarray(lons, dtype=float) - lon0)
+    
+    a = np.sin(delta_lat / 2) ** 2 + np.cos(lat0_rad) * np.cos(lats_rad) * np.sin(delta_lon / 2) ** 2
+    c = 2 * np.arcsin(np.sqrt(a))
+    
+    return (R * c).tolist()
+
+
 def parse_location_zone(location_query: str) -> Tuple[Optional[Tuple[float, float]], str]:
     """
     Parse user's location input and return approximate coordinates.
@@ -92,27 +155,25 @@ def extract_trip_duration(query: str) -> Optional[int]:
     
     Returns: number of days or None if not detected
     """
-    query_lower = query.lower()
-    
     # Check for explicit day counts
-    match = re.search(r'(\d+)\s*(?:day|night)', query_lower)
+    match = _TRIP_DAYS_PATTERN.search(query)
     if match:
         days = int(match.group(1))
         # If nights specified, convert to days (n nights = n+1 days)
-        if 'night' in query_lower[match.start():match.end()]:
+        if match.group(2).lower() == 'night':
             days = days + 1
         return days
     
     # Check for weekend (assume 2-3 days)
-    if 'weekend' in query_lower:
+    if _WEEKEND_PATTERN.search(query):
         return 3
     
     # Check for overnight/night
-    if 'overnight' in query_lower or 'one night' in query_lower:
+    if _OVERNIGHT_PATTERN.search(query):
         return 2
     
     # Check for week
-    if 'week' in query_lower:
+    if _WEEK_PATTERN.search(query):
         return 7
     
     return None
@@ -152,19 +213,18 @@ def filter_moorings_by_distance(
     if not user_position:
         return [(m, None) for m in moorings]
     
-    nearby = []
-    for mooring in moorings:
-        if 'coordinates' not in mooring or not mooring['coordinates']:
-            continue
-        
-        lat, lon = mooring['coordinates']
-        distance = haversine_distance(
-            user_position[0], user_position[1],
-            lat, lon
-        )
-        
-        if distance <= max_distance_nm:
-            nearby.append((mooring, distance))
+    candidates = [m for m in moorings if m.get('coordinates')]
+    distances = haversine_batch(
+        user_position[0], user_position[1],
+        [m['coordinates'][0] for m in candidates],
+        [m['coordinates'][1] for m in candidates]
+    )
+    
+    nearby = [
+        (mooring, distance)
+        for mooring, distance in zip(candidates, distances)
+        if distance <= max_distance_nm
+    ]
     
     # Sort by distance
     nearby.sort(key=lambda x: x[1])
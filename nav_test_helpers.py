@@ -0,0 +1,45 @@
+"""Shared helpers for the agent test scripts (not imported by the app)."""
+
+import os
+import hashlib
+from functools import lru_cache
+
+from navigator import CACHE_DIR, TRANSIENT_RESULT_PREFIXES, cache_refresh_requested
+
+# Optional on-disk cache of agent replies, so re-running a test script doesn't
+# repeat the LLM round-trips
+try:
+    from diskcache import Cache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+LLM_CACHE_DIR = os.path.join(CACHE_DIR, "llm")
+
+@lru_cache(maxsize=1)
+def get_llm_cache():
+    """The agent reply cache, opened on first use, or None without diskcache."""
+    if not DISKCACHE_AVAILABLE:
+        return None
+    return Cache(LLM_CACHE_DIR)
+
+def invoke_cached(executor, query):
+    """executor.invoke({"input": query}) with the output cached on disk by exact query.
+
+    NAV_CACHE_REFRESH matching "agent:<query>" forces a re-run.
+    Returns {"input", "output"}.
+    """
+    cache = get_llm_cache()
+    key = hashlib.sha256(query.encode("utf-8")).hexdigest()
+    if cache is not None and not cache_refresh_requested("agent", query):
+        response = cache.get(key)
+        if response is not None:
+            return response
+
+    response = executor.invoke({"input": query})
+    response = {"input": query, "output": response["output"]}
+    # Don't pin failures (iteration/time limits, tool errors) for later runs
+    if (cache is not None
+            and not response["output"].startswith(TRANSIENT_RESULT_PREFIXES + ("Agent stopped",))):
+        cache.set(key, response)
+    return response
@@ -1,9 +1,18 @@
 import os
+import json
+import logging
+import math
 import requests
+from requests.adapters import HTTPAdapter
 import urllib3
 import warnings
 import time
+import random
 import re
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
+from statistics import fmean
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
@@ -35,6 +44,46 @@ try:
 except ImportError:
     STREAMLIT_AVAILABLE = False
 
+# Optional on-disk cache so tool results survive process restarts
+try:
+    from diskcache import Cache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# Kept beside this module (not the working directory) unless NAV_CACHE_DIR says otherwise
+CACHE_DIR = os.environ.get("NAV_CACHE_DIR") or os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+@lru_cache(maxsize=1)
+def get_tool_cache():
+    """The tool result cache, opened (and created) on first use; None without diskcache."""
+    if not DISKCACHE_AVAILABLE:
+        return None
+    return Cache(os.path.join(CACHE_DIR, "tools"), size_limit=int(1e9))
+
+# Optional NumPy for scoring every fishing location in one vectorised pass
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional Aho-Corasick automaton: finds time phrases in one pass regardless of vocabulary size
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional orjson: parses API payloads several times faster than stdlib json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 # Suppress warnings
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -85,6 +134,27 @@ def check_rate_limit(api_name):
     
     return True, None
 
+# One pooled session for every NIWA and MetOcean call, so repeat requests to the
+# same host reuse the TLS connection instead of handshaking each time
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+def get_with_backoff(url, max_retries=2, max_delay=10.0, **kwargs):
+    """HTTP_SESSION.get that honours Retry-After on HTTP 429 with exponential backoff.
+    
+    Returns the last response (which may still be a 429 after max_retries).
+    """
+    for attempt in range(max_retries + 1):
+        r = HTTP_SESSION.get(url, **kwargs)
+        if r.status_code != 429 or attempt == max_retries:
+            return r
+        try:
+            delay = float(r.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            delay = 2 ** attempt
+        time.sleep(min(delay, max_delay) + random.uniform(0, 1))
+    return r
+
 def get_secret(key_name):
     """Get a secret from Streamlit Cloud or local .env file.
     
@@ -137,6 +207,14 @@ LOCATIONS = {
     "perano head": {"lat": -41.1830, "lon": 174.3160}
 }
 
+# Case-folded view of LOCATIONS for exact-name lookups
+_LOCATIONS_CF = {name.casefold(): coords for name, coords in LOCATIONS.items()}
+
+@lru_cache(maxsize=256)
+def resolve_location(name):
+    """Return the coordinates for an exact location name (any case), or None."""
+    return _LOCATIONS_CF.get(name.strip().casefold())
+
 # Cook Strait Tide Knowledge - Compass directions for flood (rising) and ebb (falling) tides
 # These are generalized patterns; actual tides vary with specific entrances and times
 TIDE_DIRECTIONS = {
@@ -166,6 +244,45 @@ TIDE_DIRECTIONS = {
     }
 }
 
+COMPASS_POINTS = ("N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE", "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW")
+
+# Compass point for every quarter degree. Sector edges (11.25° + k*22.5°) all fall on
+# quarter degrees, so indexing by floor(deg * 4) gives exactly the point the
+# int((deg + 11.25) / 22.5) % 16 formula does, without the divide per lookup
+COMPASS_LUT_STEPS = 4 * 360
+COMPASS_LUT = tuple(COMPASS_POINTS[int((q / 4 + 11.25) / 22.5) % 16] for q in range(COMPASS_LUT_STEPS))
+
+def compass_point(degrees):
+    """16-point compass name for a bearing in degrees."""
+    return COMPASS_LUT[math.floor(degrees * 4) % COMPASS_LUT_STEPS]
+
+def wind_tide_angles(wind_dirs, opposite_dir):
+    """Angle (0-180°) between each wind direction and opposite_dir, plus its compass point.
+    
+    Returns (diffs, compass) lists aligned with wind_dirs. Missing (None)
+    directions give a NaN angle, which never counts as opposition.
+    """
+    if not NUMPY_AVAILABLE:
+        diffs, compass = [], []
+        for w_dir in wind_dirs:
+            if w_dir is None:
+                diffs.append(float("nan"))
+                compass.append(None)
+                continue
+            diff = abs(w_dir - opposite_dir)
+            if diff > 180:
+                diff = 360 - diff
+            diffs.append(diff)
+            compass.append(compass_point(w_dir))
+        return diffs, compass
+    
+    wind = np.array([np.nan if d is None else d for d in wind_dirs], dtype=np.float64)
+    diff = np.abs(wind - opposite_dir)
+    diff = np.minimum(diff, 360 - diff)
+    idx = np.floor(np.nan_to_num(wind) * 4).astype(np.int64) % COMPASS_LUT_STEPS
+    compass = np.take(_COMPASS_LUT_ARRAY, idx)
+    return diff.tolist(), [None if d is None else c for d, c in zip(wind_dirs, compass.tolist())]
+
 # Fishing Location Characteristics - metadata for location recommendations
 LOCATION_CHARACTERISTICS = {
     # North Island - Wellington
@@ -185,6 +302,32 @@ LOCATION_CHARACTERISTICS = {
     "motuara island": {"difficulty": 2, "shelter": "Medium", "type": "Island", "protected": False, "best_wind": 16, "best_wave": 1.2},
 }
 
+# Struct-of-arrays view of LOCATION_CHARACTERISTICS for score_all_locations
+LOCATION_NAMES = list(LOCATION_CHARACTERISTICS)
+if NUMPY_AVAILABLE:
+    _COMPASS_LUT_ARRAY = np.array(COMPASS_LUT)
+    _LOC_DIFFICULTY = np.array([loc["difficulty"] for loc in LOCATION_CHARACTERISTICS.values()])
+    _LOC_BEST_WIND = np.array([loc["best_wind"] for loc in LOCATION_CHARACTERISTICS.values()], dtype=np.float64)
+    _LOC_BEST_WAVE = np.array([loc["best_wave"] for loc in LOCATION_CHARACTERISTICS.values()], dtype=np.float64)
+    _LOC_PROTECTED = np.array([loc["protected"] for loc in LOCATION_CHARACTERISTICS.values()], dtype=bool)
+    # Per-location constants of the scoring rules, so each call only compares against them.
+    # Rows are the wind/wave band edges in the order get_location_recommendation_score tests them
+    _LOC_WIND_BOUNDS = np.stack([_LOC_BEST_WIND - 5, _LOC_BEST_WIND, _LOC_BEST_WIND + 5, _LOC_BEST_WIND + 10])
+    _LOC_WAVE_BOUNDS = np.stack([_LOC_BEST_WAVE - 0.3, _LOC_BEST_WAVE, _LOC_BEST_WAVE + 0.3, _LOC_BEST_WAVE + 0.6])
+    _LOC_SMALL_PENALTY = np.where(_LOC_DIFFICULTY >= 3, 20, 0)
+    _LOC_MEDIUM_PENALTY = np.where(_LOC_DIFFICULTY >= 4, 15, 0)
+    _LOC_SHELTER_BONUS = np.where(_LOC_PROTECTED, 8, 0)
+    # Score change per band: index = how many band edges the value exceeds
+    WIND_DELTAS = np.array([10, 5, -5, -15, -30])
+    WAVE_DELTAS = np.array([10, 5, -5, -15, -25])
+
+# Entrance/crossing keywords for fetch_marine_data, compiled once so each query is a single scan.
+# Substring semantics on purpose: "east" also covers "eastern"/"east entrance", "north" covers
+# "northern"/"northwest", and "cross" covers "crossing"/"across"
+TORY_ENTRANCE_RE = re.compile(r"tory|east")
+KOAMARU_ENTRANCE_RE = re.compile(r"koamaru|north")
+CROSSING_RE = re.compile(r"cross")
+
 def get_location_recommendation_score(location_name, wind_kt, wave_m, boat_class, tide_state=None):
     """Score a location based on current/forecast weather conditions.
     
@@ -287,12 +430,40 @@ def get_location_recommendation_score(location_name, wind_kt, wave_m, boat_class
         "shelter": loc["shelter"]
     }
 
+def score_all_locations(wind_kt, wave_m, boat_class, tide_state=None):
+    """Scores for every location in LOCATION_NAMES order (requires NumPy).
+    
+    Same arithmetic as get_location_recommendation_score, applied to all
+    locations at once instead of one dict lookup chain per location.
+    """
+    score = np.full(len(LOCATION_NAMES), 100.0)
+    
+    if boat_class == "SMALL":
+        score -= _LOC_SMALL_PENALTY
+    elif boat_class == "MEDIUM":
+        score -= _LOC_MEDIUM_PENALTY
+    
+    # Band edges rise down each column, so the count of edges not reached is the
+    # band index; written as ~(x <= edge) so a NaN lands in the worst band
+    score += WIND_DELTAS[np.count_nonzero(~(wind_kt <= _LOC_WIND_BOUNDS), axis=0)]
+    score += WAVE_DELTAS[np.count_nonzero(~(wave_m <= _LOC_WAVE_BOUNDS), axis=0)]
+    
+    if wind_kt > 18:
+        score += _LOC_SHELTER_BONUS
+    
+    if tide_state in ["rising", "flood"]:
+        score += 5
+    elif tide_state in ["falling", "ebb"]:
+        score -= 3
+    
+    return np.clip(score, 0, 100)
+
 def recommend_fishing_locations(wind_data, wave_data, boat_class, boat_size, tide_state=None, tide_info=None, num_recommendations=3):
     """Recommend best fishing locations based on weather forecast.
     
     Args:
-        wind_data: List of wind speeds (knots) forecasted
-        wave_data: List of wave heights (meters) forecasted  
+        wind_data: Wind speeds (knots) forecasted, as a list or 1-D array
+        wave_data: Wave heights (meters) forecasted, as a list or 1-D array
         boat_class: Boat class (SMALL, MEDIUM, LARGE)
         boat_size: Boat size in meters
         tide_state: Optional current tide state
@@ -302,31 +473,44 @@ def recommend_fishing_locations(wind_data, wave_data, boat_class, boat_size, tid
     Returns:
         str with formatted location recommendations
     """
-    if not wind_data or not wave_data:
+    # len() rather than truthiness so NumPy arrays are accepted as well as lists
+    if len(wind_data) == 0 or len(wave_data) == 0:
         return ""
     
     # Use average conditions from forecast (typically first 3 time points)
-    avg_wind = sum(wind_data[:3]) / len(wind_data[:3]) if wind_data else 0
-    avg_wave = sum(wave_data[:3]) / len(wave_data[:3]) if wave_data else 0
+    # Both lists are non-empty here, so fmean never sees an empty slice
+    avg_wind = fmean(wind_data[:3])
+    avg_wave = fmean(wave_data[:3])
     
     # Get tide info for recommendations
     effective_tide = tide_state
     if not effective_tide and tide_info and 'tide_state' in tide_info:
         effective_tide = tide_info['tide_state']
     
-    # Score all fishing locations
-    scores = []
-    for location_name in LOCATION_CHARACTERISTICS.keys():
-        result = get_location_recommendation_score(
-            location_name, avg_wind, avg_wave, boat_class, effective_tide
-        )
-        scores.append(result)
-    
-    # Sort by score (highest first)
-    scores.sort(key=lambda x: x["score"], reverse=True)
-    
-    # Filter, recommendations - only suggest if score is decent (>40)
-    good_locations = [s for s in scores if s["score"] > 40]
+    if NUMPY_AVAILABLE:
+        # Rank all locations in one pass, then build reasons only for the ones shown.
+        # A stable sort keeps dict order between equal scores, as list.sort does
+        location_scores = score_all_locations(avg_wind, avg_wave, boat_class, effective_tide)
+        order = np.argsort(-location_scores, kind="stable")
+        ranked = [LOCATION_NAMES[i] for i in order if location_scores[i] > 40]
+        good_locations = [
+            get_location_recommendation_score(name, avg_wind, avg_wave, boat_class, effective_tide)
+            for name in ranked[:num_recommendations]
+        ]
+    else:
+        # Score all fishing locations
+        scores = []
+        for location_name in LOCATION_CHARACTERISTICS.keys():
+            result = get_location_recommendation_score(
+                location_name, avg_wind, avg_wave, boat_class, effective_tide
+            )
+            scores.append(result)
+        
+        # Sort by score (highest first)
+        scores.sort(key=lambda x: x["score"], reverse=True)
+        
+        # Filter, recommendations - only suggest if score is decent (>40)
+        good_locations = [s for s in scores if s["score"] > 40]
     
     if not good_locations:
         return "\n🎣 **Location Status:** Current conditions challenging for fishing - consider waiting or checking calmer bays (Mana, Titahi}\n"
@@ -342,9 +526,21 @@ def recommend_fishing_locations(wind_data, wave_data, boat_class, boat_size, tid
     
     return recommendation_text
 
+def response_json(r):
+    """Decode a JSON API response, with orjson when it's installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(r.content)
+    return r.json()
+
+# Tide predictions for a given spot and day don't change, so reuse them across runs
+TIDE_CACHE_TTL = 24 * 60 * 60
+
 def fetch_niwa_tide_data(lat, lon, days=2):
     """Fetch tide data from NIWA Tide API.
     
+    Results are kept in the tool cache keyed on (lat, lon, days, date), so repeat
+    runs on the same day skip the HTTP request.
+    
     Args:
         lat: Latitude
         lon: Longitude
@@ -353,6 +549,13 @@ def fetch_niwa_tide_data(lat, lon, days=2):
     Returns:
         dict with tide_state, magnitude_factor, description, and raw_data
     """
+    cache_key = ("niwa_tide", round(float(lat), 4), round(float(lon), 4), days, datetime.now().date().isoformat())
+    tool_cache = get_tool_cache()
+    if tool_cache is not None:
+        cached = tool_cache.get(cache_key)
+        if cached is not None:
+            return cached
+    
     try:
         # CHECK RATE LIMITING BEFORE MAKING REQUEST
         allowed, _ = check_rate_limit('niwa')
@@ -374,12 +577,12 @@ def fetch_niwa_tide_data(lat, lon, days=2):
             "apikey": api_key  # Direct query parameter
         }
         
-        r = requests.get(url, params=params, timeout=5, verify=False)
+        r = get_with_backoff(url, params=params, timeout=5, verify=False)
         
         if r.status_code != 200:
             return None
         
-        data = r.json()
+        data = response_json(r)
         
         # Parse tide heights to determine state and magnitude
         if "values" not in data or not data["values"]:
@@ -428,6 +631,9 @@ def fetch_niwa_tide_data(lat, lon, days=2):
             "raw_heights": heights[:20]
         }
         
+        if tool_cache is not None:
+            tool_cache.set(cache_key, result, expire=TIDE_CACHE_TTL)
+        
         return result
         
     except requests.exceptions.Timeout:
@@ -476,8 +682,8 @@ def fetch_marine_data(location_input, days=2):
         
         # First, check if user is specifying an entrance directly (even without "sounds" keyword)
         # This handles follow-up answers like "Tory Channel", "Tory", "Koamaru", or "Cape Koamaru"
-        has_tory = any(word in query for word in ["tory", "eastern", "east entrance", "east", "tory channel"])
-        has_koamaru = any(word in query for word in ["koamaru", "northern", "north entrance", "northwest", "north", "cape koamaru"])
+        has_tory = TORY_ENTRANCE_RE.search(query) is not None
+        has_koamaru = KOAMARU_ENTRANCE_RE.search(query) is not None
         
         # If it's just an entrance name without location context, treat it as that entrance
         if has_tory and not coords:
@@ -491,7 +697,7 @@ def fetch_marine_data(location_input, days=2):
             location_name = "Cape Koamaru (Northern Entrance)"
         
         # If user mentions "cross" or "crossing" the Strait, treat as Sounds crossing
-        if not coords and any(word in query for word in ["cross", "crossing", "cross the strait"]):
+        if not coords and CROSSING_RE.search(query):
             return ("⚠️ CLARIFICATION NEEDED:\n\n"
                    "To cross the Cook Strait, which entrance will you use?\n\n"
                    "1️⃣ TORY CHANNEL (Eastern) - or just say \"Tory\"\n"
@@ -508,10 +714,9 @@ def fetch_marine_data(location_input, days=2):
         
         # Location lookup
         if not coords:
-            clean_query = query.replace(" ", "")
+            coords = resolve_location(query)
             
-            if clean_query in LOCATIONS:
-                coords = LOCATIONS[clean_query]
+            if coords:
                 location_name = query.title()
             else:
                 for key, val in LOCATIONS.items():
@@ -548,7 +753,7 @@ def fetch_marine_data(location_input, days=2):
             "User-Agent": "CookStraitNavigator/1.0 (Marine Safety Tool)"
         }
         
-        r = requests.get(url, params=params, headers=headers, verify=False, timeout=15)
+        r = get_with_backoff(url, params=params, headers=headers, verify=False, timeout=15)
         
         if r.status_code != 200:
             error_text = r.text[:300]
@@ -556,7 +761,7 @@ def fetch_marine_data(location_input, days=2):
                    f"Error: {error_text}\n\n"
                    f"Use WebConsensus to check weather sites.")
         
-        data = r.json()
+        data = response_json(r)
         
         # Fetch NIWA tide data
         niwa_tide = fetch_niwa_tide_data(coords['lat'], coords['lon'], days=days)
@@ -605,6 +810,20 @@ def fetch_marine_data(location_input, days=2):
         opposition_events = []  # List of (index, time, wind_dir, opposition_factor)
         opposition_periods = []  # List of time strings when opposition occurs
         period_analyses = []  # Detailed analysis for each period
+        forecast_periods = []  # Compact per-period records for the observation
+        
+        # Determine tide state: use user input OR NIWA data
+        effective_tide_state = tide_state
+        if not effective_tide_state and niwa_tide and 'tide_state' in niwa_tide:
+            effective_tide_state = niwa_tide['tide_state']  # 'rising' or 'falling' from NIWA
+        
+        # Get expected tide direction from local knowledge; the tide doesn't change
+        # per period, so angles/compass points for every period are computed up front
+        tide_info = TIDE_DIRECTIONS.get(effective_tide_state) if effective_tide_state else None
+        if tide_info:
+            # Wind opposes tide if it's within 45° of opposite direction
+            opposite_dir = (tide_info["primary"] + 180) % 360
+            dir_diffs, dir_compass = wind_tide_angles(wind_dir[:max_entries], opposite_dir)
         
         for i in range(max_entries):
             w_kts = wind[i] * 1.944  # m/s to knots
@@ -614,74 +833,51 @@ def fetch_marine_data(location_input, days=2):
             w_dir = wind_dir[i] if i < len(wind_dir) else None
             
             # Detect wind vs tide opposition using available tide data
-            opposition_note = ""
             opposition_has_occurred = False
             opposition_factor = 1.0
             
-            # Determine tide state: use user input OR NIWA data
-            effective_tide_state = tide_state
-            if not effective_tide_state and niwa_tide and 'tide_state' in niwa_tide:
-                effective_tide_state = niwa_tide['tide_state']  # 'rising' or 'falling' from NIWA
-            
-            if effective_tide_state and w_dir is not None:
-                # Get expected tide direction from local knowledge
-                tide_info = TIDE_DIRECTIONS.get(effective_tide_state)
-                if tide_info:
-                    tide_min, tide_max = tide_info["range"]
-                    
-                    # Check if wind is roughly opposite to tide flow
-                    # Wind opposes tide if it's within 45° of opposite direction
-                    tide_primary = tide_info["primary"]
-                    opposite_dir = (tide_primary + 180) % 360
-                    
-                    # Calculate angle difference (circular)
-                    diff = abs(w_dir - opposite_dir)
-                    if diff > 180:
-                        diff = 360 - diff
+            if tide_info and w_dir is not None:
+                # Circular angle difference from the opposing direction, and compass point
+                diff = dir_diffs[i]
+                wind_compass = dir_compass[i]
+                
+                tide_direction_name = "Flood (NE)" if effective_tide_state in ["flood", "rising"] else "Ebb (SW)"
+                
+                if diff < 45:  # Wind is within 45° of directly opposing tide
+                    opposition_factor = 1.4  # 40% increase in chop
+                    opposition_has_occurred = True
                     
-                    # Map wind direction to compass point
-                    compass_pts = ["N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE", "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"]
-                    compass_idx = int((w_dir + 11.25) / 22.5) % 16
-                    wind_compass = compass_pts[compass_idx]
+                    # Get time for this period
+                    if i < len(times):
+                        time_str = times[i]
+                        try:
+                            if isinstance(time_str, str):
+                                dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
+                                time_display = dt.strftime('%a %d %H:%M')
+                            else:
+                                time_display = str(time_str)[:16]
+                        except:
+                            time_display = f"T+{i*3}h"
+                    else:
+                        time_display = f"T+{i*3}h"
                     
-                    tide_direction_name = "Flood (NE)" if effective_tide_state in ["flood", "rising"] else "Ebb (SW)"
+                    # Check for choppy water potential: tide range > 50cm AND wind > 7kt AND opposition
+                    tide_range = niwa_tide.get('range', 0) if niwa_tide else 0
+                    is_choppy_potential = tide_range > 0.5 and w_kts > 7
                     
-                    if diff < 45:  # Wind is within 45° of directly opposing tide
-                        opposition_factor = 1.4  # 40% increase in chop
-                        opposition_note = f" ⚠️ OPPOSES TIDE - Steep seas!"
-                        opposition_has_occurred = True
-                        
-                        # Get time for this period
-                        if i < len(times):
-                            time_str = times[i]
-                            try:
-                                if isinstance(time_str, str):
-                                    dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-                                    time_display = dt.strftime('%a %d %H:%M')
-                                else:
-                                    time_display = str(time_str)[:16]
-                            except:
-                                time_display = f"T+{i*3}h"
-                        else:
-                            time_display = f"T+{i*3}h"
-                        
-                        # Check for choppy water potential: tide range > 50cm AND wind > 7kt AND opposition
-                        tide_range = niwa_tide.get('range', 0) if niwa_tide else 0
-                        is_choppy_potential = tide_range > 0.5 and w_kts > 7
-                        
-                        opposition_events.append({
-                            'index': i,
-                            'time': time_display,
-                            'wind_dir': w_dir,
-                            'wind_compass': wind_compass,
-                            'tide_dir': tide_direction_name,
-                            'angle_diff': diff,
-                            'wind_kt': w_kts,
-                            'wave_m': wv_m,
-                            'tide_range': tide_range,
-                            'choppy_potential': is_choppy_potential  # Flagged for choppy water
-                        })
-            
+                    opposition_events.append({
+                        'index': i,
+                        'time': time_display,
+                        'wind_dir': w_dir,
+                        'wind_compass': wind_compass,
+                        'tide_dir': tide_direction_name,
+                        'angle_diff': diff,
+                        'wind_kt': w_kts,
+                        'wave_m': wv_m,
+                        'tide_range': tide_range,
+                        'choppy_potential': is_choppy_potential  # Flagged for choppy water
+                    })
+        
             # Boat-size adjusted thresholds
             if boat_size < 6.0:
                 # Small boats (< 6m): conservative thresholds
@@ -717,13 +913,13 @@ def fetch_marine_data(location_input, days=2):
             
             # Safety assessment with boat-size specific thresholds
             if w_kts > danger_wind or effective_wave > danger_wave:
-                flag = " 🔴 DANGER"
+                flag = "DANGER"
             elif w_kts > nogo_wind or effective_wave > nogo_wave:
-                flag = " 🟠 NO-GO"
+                flag = "NO-GO"
             elif w_kts > caution_wind or effective_wave > caution_wave:
-                flag = " 🟡 CAUTION"
+                flag = "CAUTION"
             else:
-                flag = " ✅ SAFE"
+                flag = "SAFE"
             
             # Time formatting
             if i < len(times):
@@ -739,12 +935,15 @@ def fetch_marine_data(location_input, days=2):
             else:
                 time_display = f"T+{i*3}h"
             
-            # Build forecast line with wind direction if available
-            direction_str = ""
-            if w_dir is not None:
-                direction_str = f" {int(w_dir)}°"
-            
-            report += f"[{time_display}] Wind: {w_kts:.0f}kt{direction_str} | Wave: {wv_m:.1f}m{flag}{opposition_note}\n"
+            # Compact record per period; human formatting happens in the Final Answer
+            period = {"time": time_display, "wind_kt": round(w_kts), "dir": int(w_dir) if w_dir is not None else None,
+                      "wave_m": round(wv_m, 1), "flag": flag}
+            if opposition_has_occurred:
+                period["opposes_tide"] = True
+            forecast_periods.append(period)
+        
+        report += "Forecast periods (JSON):\n"
+        report += json.dumps(forecast_periods, separators=(',', ':'), ensure_ascii=False) + "\n"
         
         # Build comprehensive opposition summary from ALL periods
         opposition_summary = ""
@@ -813,51 +1012,6 @@ def fetch_marine_data(location_input, days=2):
         
         report += f"\n💡 **Wind directions shown (0°=N, 90°=E, 180°=S, 270°=W)**\n"
         
-        # Add weather pattern analysis from boating guides
-        if wind and wind_dir:
-            avg_wind = sum(wind[:3]) / len(wind[:3]) if wind else 0
-            avg_wind_dir = sum(wind_dir[:3]) / len(wind_dir[:3]) if wind_dir else 0
-            
-            pattern_analysis = analyze_weather_patterns(
-                wind_speed_kt=avg_wind,
-                wind_direction=avg_wind_dir,
-                tide_state=tide_state,
-                location=location_name,
-                boat_size=boat_size
-            )
-            if pattern_analysis:
-                report += f"\n{pattern_analysis}"
-        
-        report += f"\n📏 **Vessel Class: {boat_class}** ({boat_size:.1f}m)\n"
-        report += f"🚨 Safety Thresholds:\n"
-        report += f"   • DANGER: Wind >{danger_wind}kt or Wave >{danger_wave:.1f}m\n"
-        report += f"   • NO-GO: Wind >{nogo_wind}kt or Wave >{nogo_wave:.1f}m\n"
-        report += f"   • CAUTION: Wind >{caution_wind}kt or Wave >{caution_wave:.1f}m\n"
-        
-        if tide_state:
-            tide_info = TIDE_DIRECTIONS.get(tide_state)
-            report += f"\n🌊 **Tide State: {tide_state.upper()}**\n"
-            report += f"   {tide_info['description']}\n"
-            report += f"   Opposition factor: 40% increase in effective wave chop\n"
-        else:
-            if niwa_tide:
-                report += f"\n🌊 **Tide State: Auto-detected from NIWA data**\n"
-                # Tide state will be shown in opposition_summary if NIWA data is available
-            else:
-                report += f"\n🌊 **Tide State: Not specified** (mention 'flood', 'ebb', 'rising', or 'falling' for analysis)\n"
-        
-        # Add NIWA tide magnitude info
-        if niwa_tide:
-            report += f"\n🌊 **NIWA Tide Data:**\n"
-            report += f"   {niwa_tide['description']}\n"
-            report += f"   Magnitude multiplier: {niwa_tide['magnitude_factor']:.1f}x\n"
-            if niwa_tide['magnitude'] == "SPRING":
-                report += f"   ⚠️ **Spring tide: More chop and current**\n"
-            elif niwa_tide['magnitude'] == "NEAP":
-                report += f"   ✅ **Neap tide: Calmer conditions**\n"
-        
-        report += f"\n💡 **Wind directions shown (0°=N, 90°=E, 180°=S, 270°=W)**\n"
-        
         # Add weather pattern analysis from boating guides
         if wind and wind_dir:
             avg_wind = sum(wind[:3]) / len(wind[:3]) if wind else 0
@@ -929,6 +1083,51 @@ def parse_weekend_dates(which_weekend="this"):
     
     return friday, saturday, sunday, days_ahead
 
+# Natural-language forecast lengths for fetch_weather_wrapper. One alternation,
+# longest phrase first, so "next fortnight" wins over "fortnight" in a single scan
+TIME_PHRASES = {
+    'next week': 7, 'this week': 7, 'week': 7, '7 days': 7,
+    'next 3 days': 3, 'next three days': 3, '3 days': 3, 'three days': 3,
+    'next 5 days': 5, 'next five days': 5, '5 days': 5, 'five days': 5,
+    'next 10 days': 10, 'next ten days': 10, '10 days': 10, 'ten days': 10,
+    'fortnight': 14, 'next fortnight': 14,
+    'today': 1, 'tomorrow': 1,
+}
+TIME_PHRASE_RE = re.compile(
+    '|'.join(re.escape(p) for p in sorted(TIME_PHRASES, key=len, reverse=True)), re.IGNORECASE
+)
+
+def build_time_phrase_automaton():
+    """Automaton mapping each time phrase to (length, days), or None without pyahocorasick"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for phrase, days in TIME_PHRASES.items():
+        automaton.add_word(phrase, (len(phrase), days))
+    automaton.make_automaton()
+    return automaton
+
+TIME_PHRASE_AUTOMATON = build_time_phrase_automaton()
+
+def find_time_phrase(text):
+    """Return (start, end, days) for the leftmost, longest time phrase in text, or None.
+    
+    Same match as TIME_PHRASE_RE.search. The automaton scans lowercased text, so
+    it's only used when lowercasing keeps the offsets valid.
+    """
+    text_lower = text.lower()
+    if TIME_PHRASE_AUTOMATON is not None and len(text_lower) == len(text):
+        best = None
+        for last, (length, days) in TIME_PHRASE_AUTOMATON.iter(text_lower):
+            start = last - length + 1
+            if best is None or start < best[0] or (start == best[0] and last >= best[1]):
+                best = (start, last + 1, days)
+        return best
+    match = TIME_PHRASE_RE.search(text)
+    if match:
+        return match.start(), match.end(), TIME_PHRASES[match.group(0).lower()]
+    return None
+
 def fetch_weather_wrapper(input_str):
     """Wrapper that handles location and optional days parameter.
     
@@ -972,22 +1171,12 @@ def fetch_weather_wrapper(input_str):
     
     # Try other time phrases if not weekend
     if requested_days is None:
-        time_phrases = {
-            'next week': 7, 'this week': 7, 'week': 7, '7 days': 7,
-            'next 3 days': 3, 'next three days': 3, '3 days': 3, 'three days': 3,
-            'next 5 days': 5, 'next five days': 5, '5 days': 5, 'five days': 5,
-            'next 10 days': 10, 'next ten days': 10, '10 days': 10, 'ten days': 10,
-            'fortnight': 14, 'next fortnight': 14,
-            'today': 1, 'tomorrow': 1,
-        }
-        
-        for phrase, day_count in time_phrases.items():
-            if phrase in input_lower:
-                requested_days = day_count
-                days = day_count
-                # Remove the time phrase from location string
-                location = input_str.replace(phrase, '', 1).replace(phrase.title(), '', 1).strip(' ,for\t')
-                break
+        found = find_time_phrase(input_str)
+        if found:
+            start, end, requested_days = found
+            days = requested_days
+            # Remove the time phrase from location string
+            location = (input_str[:start] + input_str[end:]).strip(' ,for\t')
     
     # If no natural language match, try comma-separated format
     if requested_days is None and ',' in str(input_str):
@@ -1000,10 +1189,20 @@ def fetch_weather_wrapper(input_str):
             except ValueError:
                 pass  # keep default
     
+    return fetch_weather(location, days, weekend_context=weekend_context)
+
+def fetch_weather(location, days=2, weekend_context=None):
+    """Typed weather entry point once the tool input has been parsed.
+    
+    Args:
+        location: Location name or query
+        days: Number of days to forecast (capped at 10)
+        weekend_context: Optional "(Friday .. – Sunday ..)" label to prefix
+    """
     # If user requested more than 10 days, inform them of the limit
-    if requested_days and requested_days > 10:
+    if days > 10:
         result = fetch_marine_data(location, 10)  # Get 10-day forecast
-        return (f"⚠️ **Note:** You requested a {requested_days}-day forecast, but marine weather forecasts "
+        return (f"⚠️ **Note:** You requested a {days}-day forecast, but marine weather forecasts "
                 f"beyond 10 days are generally unreliable due to rapidly changing conditions. "
                 f"Showing 10-day forecast instead.\n\n{result}")
     
@@ -1279,6 +1478,10 @@ def search_mooring_locations(query):
     except Exception as e:
         return f"⚠️ Error searching mooring data: {str(e)}. Please ask for a specific location name (e.g., 'Ship Cove', 'Port Underwood') or which area of the Sounds you're in."
 
+def bite_times_unavailable(error):
+    """Fallback reply when bite times can't be parsed or fetched."""
+    return f"⚠️ Bite times currently unavailable. Visit https://www.fishing.net.nz/fishing-advice/bite-times/ for live data. Error: {str(error)}"
+
 def fetch_bite_times_wrapper(days_input):
     """Fetch bite times from fishing.net.nz for fishing recommendations"""
     try:
@@ -1287,20 +1490,164 @@ def fetch_bite_times_wrapper(days_input):
         
         if 'day' in days_input.lower():
             # Try to extract number
-            import re
             match = re.search(r'(\d+)', days_input)
             if match:
-                days = min(int(match.group(1)), 14)  # Max 14 days
-        
-        return get_bite_times_for_agent(location="wellington", days=days)
+                days = int(match.group(1))
+    except Exception as e:
+        return bite_times_unavailable(e)
+    
+    return fetch_bite_times(days)
+
+def fetch_bite_times(days=3):
+    """Typed bite times entry point (max 14 days)."""
+    try:
+        return get_bite_times_for_agent(location="wellington", days=min(days, 14))
+    except Exception as e:
+        return bite_times_unavailable(e)
+
+# --- TOOL OUTPUT CACHE ---
+WEATHER_CACHE_TTL = 15 * 60        # Forecasts refresh every 15 minutes
+KNOWLEDGE_CACHE_TTL = 24 * 60 * 60  # Boating guides are static
+FISHING_REPORTS_CACHE_TTL = 60 * 60  # Reports change whenever ingest_knowledge.py is re-run
+
+# Error/throttle messages are never cached
+TRANSIENT_RESULT_PREFIXES = ("⚠️", "❌", "⏳", "ℹ️ Knowledge base temporarily unavailable")
+
+# In-flight tool calls, so concurrent identical requests share one upstream call
+INFLIGHT_REQUESTS = {}
+INFLIGHT_LOCK = threading.Lock()
+
+def cache_refresh_requested(tool_name, normalized_input):
+    """True if the NAV_CACHE_REFRESH regex matches "<tool>:<input>"."""
+    pattern = os.environ.get("NAV_CACHE_REFRESH")
+    return bool(pattern) and re.search(pattern, f"{tool_name}:{normalized_input}") is not None
+
+def cached_tool_call(tool_name, func, tool_input, expire, refresh=False):
+    """Call a tool function through the on-disk tool cache, keyed on (tool, input).
+    
+    Concurrent callers with the same key wait for the first caller's result
+    instead of issuing duplicate API requests. Falls back to no caching when
+    diskcache is not installed. refresh=True (or a matching NAV_CACHE_REFRESH
+    regex, e.g. "FishingReports:.*snapper") skips the cache read.
+    """
+    key = (tool_name, " ".join(str(tool_input).lower().split()))
+    refresh = refresh or cache_refresh_requested(*key)
+    tool_cache = get_tool_cache()
+    if tool_cache is not None and not refresh:
+        result = tool_cache.get(key)
+        if result is not None:
+            return result
+    
+    with INFLIGHT_LOCK:
+        future = INFLIGHT_REQUESTS.get(key)
+        is_owner = future is None
+        if is_owner:
+            # An owner caches its result before leaving INFLIGHT_REQUESTS, so a
+            # caller that missed above but finds no future here re-checks the cache
+            if tool_cache is not None and not refresh:
+                result = tool_cache.get(key)
+                if result is not None:
+                    return result
+            future = Future()
+            INFLIGHT_REQUESTS[key] = future
+    
+    if not is_owner:
+        return future.result()
+    
+    try:
+        result = func(tool_input)
+        if (tool_cache is not None and isinstance(result, str)
+                and not result.startswith(TRANSIENT_RESULT_PREFIXES)):
+            tool_cache.set(key, result, expire=expire)
+        future.set_result(result)
+        return result
     except Exception as e:
-        return f"⚠️ Bite times currently unavailable. Visit https://www.fishing.net.nz/fishing-advice/bite-times/ for live data. Error: {str(e)}"
+        future.set_exception(e)
+        raise
+    finally:
+        with INFLIGHT_LOCK:
+            INFLIGHT_REQUESTS.pop(key, None)
 
+def cached_fetch_weather(input_str):
+    """fetch_weather_wrapper backed by the tool cache."""
+    return cached_tool_call("WeatherTideAPI", fetch_weather_wrapper, input_str, WEATHER_CACHE_TTL)
+
+def cached_search_books(query):
+    """search_books backed by the tool cache."""
+    return cached_tool_call("LocalKnowledge", search_books, query, KNOWLEDGE_CACHE_TTL)
+
+def cached_search_fishing_reports(query):
+    """search_fishing_reports backed by the tool cache."""
+    return cached_tool_call("FishingReports", search_fishing_reports, query, FISHING_REPORTS_CACHE_TTL)
+
+# --- CACHE PRE-WARMING ---
+PREWARM_LOCATIONS = ["mana marina", "cook strait", "tory channel", "cape koamaru", "plimmerton", "pukerua bay"]
+PREWARM_MAX_JITTER = 300  # seconds
+
+PREWARM_MAX_BACKOFF = 60 * 60  # seconds
+
+def _prewarm_loop(locations, interval):
+    """Refresh each location once per interval, staggered and jittered.
+    
+    Failures (exceptions or error replies) are logged, and each consecutive
+    one doubles the wait before the next fetch, up to PREWARM_MAX_BACKOFF.
+    """
+    failures = 0
+    while True:
+        # Random start offset so refreshes never line up on the exact minute
+        jitter = random.uniform(0, min(PREWARM_MAX_JITTER, interval / 2))
+        time.sleep(jitter)
+        slot = (interval - jitter) / len(locations)
+        for location in locations:
+            try:
+                result = cached_tool_call("WeatherTideAPI", fetch_weather_wrapper, location, WEATHER_CACHE_TTL, refresh=True)
+                ok = not (isinstance(result, str) and result.startswith(TRANSIENT_RESULT_PREFIXES))
+                if not ok:
+                    logger.warning("Weather prewarm for %r returned an error: %s", location, result[:200])
+            except Exception:
+                ok = False
+                logger.warning("Weather prewarm for %r failed", location, exc_info=True)
+            
+            if ok:
+                failures = 0
+                time.sleep(slot)
+            else:
+                failures += 1
+                time.sleep(min(slot * 2 ** failures, PREWARM_MAX_BACKOFF))
+
+def start_weather_prewarm(locations=None, interval=WEATHER_CACHE_TTL):
+    """Start a daemon thread keeping common forecasts warm in the tool cache.
+    
+    Locations are spread evenly across the interval instead of being fetched
+    together, avoiding bursts against the MetOcean/NIWA rate limits.
+    
+    Returns:
+        The started thread, or None if diskcache is not available
+    """
+    if not DISKCACHE_AVAILABLE:
+        return None
+    
+    thread = threading.Thread(
+        target=_prewarm_loop,
+        args=(locations or PREWARM_LOCATIONS, interval),
+        name="weather-prewarm",
+        daemon=True
+    )
+    thread.start()
+    return thread
+
+def current_time_str():
+    """Timestamp for the agent prompt, evaluated each time the prompt is formatted."""
+    return datetime.now().strftime("%A, %B %d, %Y, %H:%M NZDT")
+
+@lru_cache(maxsize=1)
 def get_updated_executor():
-    """Create agent with smart journey planning for both crossings and local trips."""
-    now = datetime.now()
-    current_time_str = now.strftime("%A, %B %d, %Y, %H:%M NZDT")
+    """Create agent with smart journey planning for both crossings and local trips.
     
+    Built once per process and shared (app reruns, test scripts): the executor
+    holds no per-conversation state, and the prompt's current time is a
+    callable partial so it stays current.
+    """
     template = """You are Cook Strait Navigator - expert marine safety advisor for New Zealand waters.
 
 Current Time: {current_time_str}
@@ -2082,8 +2429,8 @@ Question: {input}
     tools = [
         Tool(
             name="WeatherTideAPI", 
-            func=fetch_weather_wrapper, 
-            description="Get marine weather forecast with wind/wave data and safety flags (✅SAFE/🟡CAUTION/🟠NO-GO). Input format: 'location' for 2-day forecast OR 'location, days' for custom forecasts (e.g., 'mana marina, 7' for 7 days, 'pukerua bay, 5' for 5 days). Maximum 10 days (marine forecasts beyond this are unreliable). Use extended forecasts for 'best time' analysis queries. Locations: mana marina, cook strait, tory channel, cape koamaru, plimmerton, pukerua bay, etc."
+            func=cached_fetch_weather, 
+            description="Get marine weather forecast with wind/wave data and safety flags (SAFE/CAUTION/NO-GO/DANGER). Forecast periods are returned as compact JSON records (time, wind_kt, dir, wave_m, flag, opposes_tide) - reason over the fields directly and format them for the user in your Final Answer. Input format: 'location' for 2-day forecast OR 'location, days' for custom forecasts (e.g., 'mana marina, 7' for 7 days, 'pukerua bay, 5' for 5 days). Maximum 10 days (marine forecasts beyond this are unreliable). Use extended forecasts for 'best time' analysis queries. Locations: mana marina, cook strait, tory channel, cape koamaru, plimmerton, pukerua bay, etc."
         ),
         Tool(
             name="WebConsensus", 
@@ -2092,12 +2439,12 @@ Question: {input}
         ),
         Tool(
             name="LocalKnowledge", 
-            func=search_books, 
+            func=cached_search_books, 
             description="Search maritime PDFs for rocks, rips, tide considerations, and local hazards. Essential for understanding area-specific dangers. Input: location name"
         ),
         Tool(
             name="FishingReports", 
-            func=search_fishing_reports, 
+            func=cached_search_fishing_reports, 
             description="Search historical fishing reports for species, techniques, best conditions (wind/tide/time), and successful locations. Use when users ask about fishing or want location recommendations based on weather patterns. Input: query about species, location, or conditions (e.g., 'snapper light northerlies', 'Pukerua Bay', 'blue cod ebbing tide')"
         ),
         Tool(
@@ -2,15 +2,96 @@
 """
 Scrape fishing reports from fishing.net.nz forum and bite times calendar.
 Automatically creates fishing report files for Wellington/Kapiti locations.
+
+Requires: pip install requests beautifulsoup4
+Optional speedups: lxml, selectolax, pyahocorasick, requests-cache, orjson
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import json
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import re
 import os
 from pathlib import Path
+from functools import lru_cache
+
+# Prefer the C-backed lxml parser; fall back to the pure-Python one if missing
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# selectolax (lexbor) is much faster than BeautifulSoup for the hot parse path
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# Aho-Corasick finds every keyword in a single pass over the text
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# orjson serializes in C and writes bytes directly
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# requests-cache keeps responses on disk between runs and revalidates them with
+# ETag / Last-Modified, so an unchanged page costs a 304 rather than a full download
+try:
+    import requests_cache
+    REQUESTS_CACHE_AVAILABLE = True
+except ImportError:
+    REQUESTS_CACHE_AVAILABLE = False
+
+# Same cache root as navigator: beside this module unless NAV_CACHE_DIR says otherwise
+CACHE_DIR = os.environ.get("NAV_CACHE_DIR") or os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+def _pooled(session):
+    """Give a session the scraper's User-Agent and a pooled, retrying adapter"""
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    })
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                          max_retries=Retry(total=2, backoff_factor=0.3))
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+@lru_cache(maxsize=1)
+def get_session():
+    """Shared session, so repeat requests to the same host reuse the TLS connection.
+    
+    Opened on first use; responses are cached on disk when requests-cache is installed.
+    """
+    if REQUESTS_CACHE_AVAILABLE:
+        return _pooled(requests_cache.CachedSession(
+            os.path.join(CACHE_DIR, 'fishing_scrape'), backend='sqlite', expire_after=3600,
+            cache_control=True, stale_if_error=True
+        ))
+    return _pooled(requests.Session())
+
+@lru_cache(maxsize=1)
+def get_stream_session():
+    """Uncached session for byte-capped streaming reads.
+    
+    requests-cache reads and stores the whole body on a miss, before the
+    caller's capped read runs, so capped fetches must bypass it.
+    """
+    if not REQUESTS_CACHE_AVAILABLE:
+        return get_session()
+    return _pooled(requests.Session())
 
 # Locations we're interested in
 TARGET_LOCATIONS = {
@@ -19,51 +100,155 @@ TARGET_LOCATIONS = {
     'other_local': ['Pukerua', 'Mana Island', 'Tory Channel', 'Cook Strait', 'Picton']
 }
 
+# Flattened (region, name, lowercase name) triples, so constants are lowercased once at import
+_FLAT_LOCATIONS = tuple((region, loc, loc.lower())
+                        for region, locs in TARGET_LOCATIONS.items() for loc in locs)
+LOCATION_KEYWORDS = tuple(loc_lc for _, _, loc_lc in _FLAT_LOCATIONS)
+
+# Keywords for markdown generation, stored lowercase
+SPECIES_KEYWORDS = ['snapper', 'kahawai', 'gurnard', 'kingfish', 'blue cod',
+                    'tarakihi', 'trevally', 'yellowtail', 'groper', 'hapuka']
+CONDITION_LABELS = {'calm': 'Light winds', 'northerly': 'Northerlies',
+                    'southerly': 'Southerlies', 'tide': 'Variable tides'}
+
+# One alternation per keyword list, so each report is scanned once per list.
+# Only the leading edge is anchored so plurals ("tides", "snappers") still match.
+_SPECIES_RE = re.compile(r'\b(' + '|'.join(map(re.escape, SPECIES_KEYWORDS)) + ')', re.I)
+_CONDITIONS_RE = re.compile(r'\b(' + '|'.join(CONDITION_LABELS) + ')', re.I)
+
+def build_keyword_automaton(keywords):
+    """Build an automaton mapping each lowercase keyword to its list index"""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for i, keyword in enumerate(keywords):
+        automaton.add_word(keyword, i)
+    automaton.make_automaton()
+    return automaton
+
+LOCATION_AUTOMATON = build_keyword_automaton(LOCATION_KEYWORDS)
+
+def find_keyword_indexes(text_lower, keywords, automaton):
+    """Return sorted indexes of the keywords that occur in text_lower"""
+    if automaton is not None:
+        return sorted({i for _, i in automaton.iter(text_lower)})
+    return [i for i, keyword in enumerate(keywords) if keyword in text_lower]
+
+# Regexes compiled once at import (used in per-post / per-day loops)
+_DAY_RE = re.compile(r'^(Mon|Tue|Wed|Thu|Fri|Sat|Sun)')
+_TIME_RE = re.compile(r'(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})')
+_POST_CLASS_RE = re.compile('post|thread|report', re.I)
+_CONTENT_CLASS_RE = re.compile('content|body', re.I)
+_POST_OR_CONTENT_CLASS_RE = re.compile('post|thread|report|content|body', re.I)
+_FILENAME_RE = re.compile(r'[^\w\s-]')
+
+# Byte-level sentinels: if these are missing there is nothing to parse (e.g. a block page)
+_H5_MARKER_RE = re.compile(rb'<h5', re.I)
+_POST_MARKER_RE = re.compile(rb'<article|class=["\']?[^"\'>]*(?:post|thread|report|content|body)', re.I)
+
+# CSS equivalents of the BeautifulSoup class regexes (case-insensitive substring match)
+POST_SELECTOR = ', '.join(f'{tag}[class*={word} i]' for tag in ('article', 'div') for word in ('post', 'thread', 'report'))
+CONTENT_SELECTOR = 'div[class*=content i], div[class*=body i]'
+
+# Only build BeautifulSoup trees for candidate post containers
+POST_STRAINER = SoupStrainer(['article', 'div'], class_=_POST_OR_CONTENT_CLASS_RE)
+
+# Forum posts of interest are near the top of the page; don't read more than this
+MAX_FORUM_BYTES = 512_000
+
+def extract_day_sections(content):
+    """Return (day_header_text, section_text) for each <h5> with a parent element"""
+    if SELECTOLAX_AVAILABLE:
+        tree = LexborHTMLParser(content)
+        return [(h5.text(strip=True), h5.parent.text())
+                for h5 in tree.css('h5') if h5.parent is not None]
+    
+    soup = BeautifulSoup(content, HTML_PARSER)
+    sections = []
+    for day_elem in soup.find_all('h5'):
+        parent = day_elem.find_parent()
+        if parent:
+            sections.append((day_elem.get_text(strip=True), parent.get_text()))
+    return sections
+
+def extract_post_texts(content, limit=20):
+    """Return the text of up to `limit` candidate forum post containers"""
+    if SELECTOLAX_AVAILABLE:
+        tree = LexborHTMLParser(content)
+        posts = tree.css(POST_SELECTOR)
+        if not posts:
+            # Fallback: look for any content with location names
+            posts = tree.css(CONTENT_SELECTOR)
+        return [post.text(separator=' ', strip=True) for post in posts[:limit]]
+    
+    soup = BeautifulSoup(content, HTML_PARSER, parse_only=POST_STRAINER)
+    
+    # Try to find post containers (structure varies by forum)
+    posts = soup.find_all(['article', 'div'], class_=_POST_CLASS_RE)
+    
+    if not posts:
+        # Fallback: look for any content with location names
+        posts = soup.find_all('div', class_=_CONTENT_CLASS_RE)
+    
+    # Join text nodes with spaces so adjacent words don't run together
+    return [post.get_text(separator=' ', strip=True) for post in posts[:limit]]
+
+BITE_TIME_SOURCES = [
+    "https://www.bitetimes.fishing/bite-times/kapiti-island",
+    "https://www.fishing.net.nz/fishing-advice/bite-times/"
+]
+
+def fetch_bite_times_source(url):
+    """Fetch and parse bite times from a single source (None on failure)"""
+    try:
+        print(f"🎣 Trying bite times from {url.split('/')[2]}...")
+        response = get_session().get(url, timeout=10)
+        response.raise_for_status()
+        
+        # Block/challenge pages are often non-HTML or lack the day headers entirely
+        if 'html' not in response.headers.get('Content-Type', ''):
+            print(f"⚠️  {url.split('/')[2]} returned non-HTML content")
+            return None
+        body = response.content
+        if not _H5_MARKER_RE.search(body):
+            print(f"⚠️  {url.split('/')[2]} returned no schedule")
+            return None
+        
+        # Extract bite times data - looking for major/minor bites and times
+        bite_data = {}
+        
+        # Parse the schedule section
+        for day_text, time_text in extract_day_sections(body):
+            if not _DAY_RE.match(day_text):
+                continue
+                
+            # Look for major and minor bite times in format HH:MM - HH:MM
+            times = _TIME_RE.findall(time_text)
+            if times:
+                bite_data[day_text] = times
+        
+        return bite_data or None
+        
+    except Exception as e:
+        print(f"⚠️  {url.split('/')[2]} failed: {e}")
+        return None
+
 def scrape_bite_times():
-    """Fetch and parse bite times from fishing sites"""
-    sources = [
-        "https://www.bitetimes.fishing/bite-times/kapiti-island",
-        "https://www.fishing.net.nz/fishing-advice/bite-times/"
-    ]
+    """Fetch and parse bite times from fishing sites
     
-    for url in sources:
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            
-            print(f"🎣 Trying bite times from {url.split('/')[2]}...")
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract bite times data - looking for major/minor bites and times
-            bite_data = {}
-            
-            # Parse the schedule section
-            days = soup.find_all('h5')
-            for day_elem in days:
-                day_text = day_elem.get_text(strip=True)
-                if not re.match(r'^(Mon|Tue|Wed|Thu|Fri|Sat|Sun)', day_text):
-                    continue
-                    
-                # Extract date and times
-                parent = day_elem.find_parent()
-                if parent:
-                    time_text = parent.get_text()
-                    # Look for major and minor bite times in format HH:MM - HH:MM
-                    times = re.findall(r'(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2})', time_text)
-                    if times:
-                        bite_data[day_text] = times
-            
+    All sources are fetched concurrently; the first one to return data wins.
+    """
+    executor = ThreadPoolExecutor(max_workers=len(BITE_TIME_SOURCES))
+    try:
+        futures = {executor.submit(fetch_bite_times_source, url): url for url in BITE_TIME_SOURCES}
+        for future in as_completed(futures):
+            bite_data = future.result()
             if bite_data:
-                print(f"✅ SUCCESS fetching from {url.split('/')[2]}")
+                print(f"✅ SUCCESS fetching from {futures[future].split('/')[2]}")
                 return bite_data
-            
-        except Exception as e:
-            print(f"⚠️  {url.split('/')[2]} failed: {e}")
-            continue
+    finally:
+        # Don't wait for slower sources once we have an answer
+        executor.shutdown(wait=False, cancel_futures=True)
     
     print("❌ All bite time sources blocked or unavailable")
     return None
@@ -72,48 +257,56 @@ def scrape_forum_reports():
     """Scrape fishing reports from fishing.net.nz forum"""
     try:
         forum_url = "https://www.fishing.net.nz/forum/"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        }
         
         print("🌐 Scraping fishing forum reports...")
-        response = requests.get(forum_url, headers=headers, timeout=10)
-        response.raise_for_status()
+        with get_stream_session().get(forum_url, timeout=10, stream=True) as response:
+            response.raise_for_status()
+            if 'html' not in response.headers.get('Content-Type', ''):
+                print("⚠️  Forum returned non-HTML content")
+                return None
+            body = response.raw.read(MAX_FORUM_BYTES, decode_content=True)
+        
+        # Skip the parse when the page has no candidate post containers at all
+        if not _POST_MARKER_RE.search(body):
+            print("⚠️  Forum page has no post containers")
+            return None
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        # All posts from this page share one scrape timestamp
+        scrape_ts = datetime.now().isoformat()
         
         # Look for forum threads/posts about fishing
         reports = []
+        seen = set()
+        kept_texts = []
         
-        # Try to find post containers (structure varies by forum)
-        posts = soup.find_all(['article', 'div'], class_=re.compile('post|thread|report', re.I))
-        
-        if not posts:
-            # Fallback: look for any content with location names
-            posts = soup.find_all('div', class_=re.compile('content|body', re.I))
-        
-        for post in posts[:20]:  # Limit to avoid timeouts
-            text = post.get_text()
+        for text in extract_post_texts(body, limit=20):  # Limit to avoid timeouts
+            # Skip repeated posts, and inner containers whose text is already
+            # part of an outer container we kept (nested article/div matches)
+            key = hash(text[:200])
+            if key in seen:
+                continue
+            seen.add(key)
+            if any(text in kept for kept in kept_texts):
+                continue
+            kept_texts.append(text)
             
-            # Check if post mentions our target locations
+            text_lower = text.lower()
+            
+            # Check if post mentions our target locations (first in TARGET_LOCATIONS order wins)
             location_found = False
             location_name = None
             
-            for region, locs in TARGET_LOCATIONS.items():
-                for loc in locs:
-                    if loc.lower() in text.lower():
-                        location_found = True
-                        location_name = loc
-                        break
-                if location_found:
-                    break
+            hits = find_keyword_indexes(text_lower, LOCATION_KEYWORDS, LOCATION_AUTOMATON)
+            if hits:
+                location_found = True
+                _, location_name, _ = _FLAT_LOCATIONS[hits[0]]
             
             if location_found and len(text) > 100:
                 # Extract relevant fishing information
                 report = {
                     'location': location_name,
                     'text': text[:500],  # First 500 chars
-                    'timestamp': datetime.now().isoformat(),
+                    'timestamp': scrape_ts,
                     'source': 'fishing.net.nz forum'
                 }
                 reports.append(report)
@@ -124,48 +317,23 @@ def scrape_forum_reports():
         print(f"❌ Error scraping forum: {e}")
         return None
 
-def parse_forum_report_to_markdown(report, location_data=None):
-    """Convert scraped forum data to markdown fishing report format"""
-    
-    text = report.get('text', '')
-    location = report.get('location', 'Unknown')
-    
-    # Extract any fish species mentioned
-    species_keywords = ['snapper', 'kahawai', 'gurnard', 'kingfish', 'blue cod', 
-                       'tarakihi', 'trevally', 'yellowtail', 'groper', 'hapuka']
-    species_found = []
-    for species in species_keywords:
-        if species.lower() in text.lower():
-            species_found.append(species.capitalize())
-    
-    # Extract conditions if mentioned
-    conditions = []
-    if 'calm' in text.lower():
-        conditions.append('Light winds')
-    if 'northerly' in text.lower():
-        conditions.append('Northerlies')
-    if 'southerly' in text.lower():
-        conditions.append('Southerlies')
-    if 'tide' in text.lower():
-        conditions.append('Variable tides')
-    
-    # Build markdown report
-    markdown = f"""## {location.upper()}
+# Markdown layout for auto-generated forum reports, filled in per report
+_MD_TEMPLATE = """## {location_upper}
 
 ### Location
 {location}, Wellington Region
 Source: fishing.net.nz forum
-Scraped: {report.get('timestamp', 'Unknown')}
+Scraped: {timestamp}
 
 ### Recent Forum Reports
 **Report Snippet**:
 {text}
 
 ### Species Mentioned
-{', '.join(species_found) if species_found else 'Various'}
+{species}
 
 ### Conditions Noted  
-{', '.join(conditions) if conditions else 'Variable conditions'}
+{conditions}
 
 ### To Add This Systematically
 This report was auto-generated from forum data. To add manual validation:
@@ -177,8 +345,39 @@ This report was auto-generated from forum data. To add manual validation:
 ### Source
 fishing.net.nz forum
 """
+
+def parse_forum_report_to_markdown(report, location_data=None):
+    """Convert scraped forum data to markdown fishing report format"""
     
-    return markdown
+    text = report.get('text', '')
+    location = report.get('location', 'Unknown')
+    
+    # Extract any fish species mentioned
+    species_found = sorted({m.group(1).capitalize() for m in _SPECIES_RE.finditer(text)})
+    
+    # Extract conditions if mentioned
+    conditions = sorted({CONDITION_LABELS[m.group(1).lower()] for m in _CONDITIONS_RE.finditer(text)})
+    
+    return _MD_TEMPLATE.format(
+        location_upper=location.upper(),
+        location=location,
+        timestamp=report.get('timestamp', 'Unknown'),
+        text=text,
+        species=', '.join(species_found) or 'Various',
+        conditions=', '.join(conditions) or 'Variable conditions'
+    )
+
+def _write_report(report, filepath):
+    """Render one forum report to markdown and write it (returns 1 if created)"""
+    markdown = parse_forum_report_to_markdown(report)
+    
+    try:
+        filepath.write_text(markdown, encoding='utf-8')
+        print(f"✅ Created {filepath.name}")
+        return 1
+    except Exception as e:
+        print(f"❌ Failed to create {filepath.name}: {e}")
+        return 0
 
 def create_automated_reports(forum_reports):
     """Create markdown files from forum reports"""
@@ -188,31 +387,32 @@ def create_automated_reports(forum_reports):
         return 0
     
     fishing_reports_dir = Path("fishing_reports")
-    if not fishing_reports_dir.exists():
-        fishing_reports_dir.mkdir(parents=True)
+    fishing_reports_dir.mkdir(parents=True, exist_ok=True)
     
-    created = 0
+    # One directory scan instead of a stat() per report
+    existing = {entry.name for entry in os.scandir(fishing_reports_dir)}
+    
+    # Claim filenames up front so two reports for one location never race
+    pending = []
     for report in forum_reports:
         location = report.get('location', 'Unknown')
         
         # Clean filename
-        filename = re.sub(r'[^\w\s-]', '', location).strip().replace(' ', '_').upper()
+        filename = _FILENAME_RE.sub('', location).strip().replace(' ', '_').upper()
         filepath = fishing_reports_dir / f"{filename}_FORUM.md"
         
         # Don't overwrite existing detailed reports
-        if filepath.exists():
+        if filepath.name in existing:
             print(f"⏭️  Skipping {filepath.name} (already exists)")
             continue
         
-        markdown = parse_forum_report_to_markdown(report)
-        
-        try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(markdown)
-            print(f"✅ Created {filepath.name}")
-            created += 1
-        except Exception as e:
-            print(f"❌ Failed to create {filepath.name}: {e}")
+        existing.add(filepath.name)
+        pending.append((report, filepath))
+    
+    # File writes are I/O bound, so threads overlap them despite the GIL
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(_write_report, report, filepath) for report, filepath in pending]
+        created = sum(future.result() for future in futures)
     
     return created
 
@@ -233,8 +433,10 @@ def save_bite_times_reference(bite_times):
             'note': 'Major and minor bite times for each day. Use this to enhance fishing recommendations.'
         }
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        if ORJSON_AVAILABLE:
+            filepath.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            filepath.write_text(json.dumps(data, indent=2), encoding='utf-8')
         
         print(f"💾 Saved bite times to {filepath.name}")
         return True
@@ -248,15 +450,6 @@ def main():
     print("🎣 FISHING DATA SCRAPER - Wellington & Kapiti Region")
     print("="*60 + "\n")
     
-    # Check if requests library is available
-    try:
-        import requests
-        import bs4
-    except ImportError:
-        print("⚠️  Required libraries not installed.")
-        print("Run: pip install requests beautifulsoup4")
-        return
-    
     # Fetch bite times
     print("📅 Step 1: Fetching bite times calendar...")
     bite_times = scrape_bite_times()
@@ -3,7 +3,8 @@
 Forum fishing report scraper - extracts fishing data from provided forum links.
 Automatically parses reports and creates markdown files for each location/entry.
 
-Uses Selenium for browser automation to bypass anti-scraping protections.
+Fetches pages over plain HTTP where possible and falls back to Selenium browser
+automation to bypass anti-scraping protections.
 
 Usage:
     python scrape_forum_fishing.py --url "https://forum.example.com/thread/123"
@@ -12,27 +13,251 @@ Usage:
 """
 
 import requests
-from bs4 import BeautifulSoup
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 import re
+import shutil
 import sys
 import argparse
 from urllib.parse import urlparse
 import time
+import queue
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+# Profile slot locks: flock on POSIX, msvcrt byte locks on Windows
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+# undetected_chromedriver/selenium are imported when a browser is first needed:
+# they are slow to import and most pages are fetched without one.
+# BeautifulSoup is likewise only imported if selectolax is missing.
+
+# selectolax (lexbor) parses and runs CSS selectors in C, far faster than BeautifulSoup
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+# orjson serializes in C and writes bytes directly
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Aho-Corasick finds every keyword in a single pass over the text
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# If we do fall back to BeautifulSoup, prefer the C-backed lxml parser
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+
+# Regexes compiled once at import (run per post / per page)
+_CONDITION_RES = {
+    'Wind': [re.compile(r'(north|south|east|west|calm|light|strong|building|shifting)\s*(wind|breeze|northerly|southerly|easterly|westerly|northerlies|southerlies)', re.I),
+             re.compile(r'(\d+)\s*kt.*?(wind|breeze)', re.I),
+             re.compile(r'(calm|light|moderate|strong|gusty|shifty|variable)\s*(conditions|wind)', re.I)],
+    'Tide': [re.compile(r'(slack|running|strong|ebbing|flowing|flood|ebb)\s*(tide|water)', re.I),
+             re.compile(r'(incoming|outgoing|high|low)\s*tide', re.I),
+             re.compile(r'tide.*?(running|slack|strong|weak)', re.I)],
+    'Sea State': [re.compile(r'(smooth|calm|rough|choppy|lumpy|swell)\s*(sea|conditions|water)', re.I),
+                  re.compile(r'(\d+).*?(metre|foot).*?(wave|swell)', re.I)],
+    'Weather': [re.compile(r'(sunny|cloudy|overcast|rainy|clear|misty|foggy).*?(conditions|morning|afternoon)', re.I),
+                re.compile(r'(clear skies|good weather|poor conditions)', re.I)]
+}
+_COUNT_RE = re.compile(r'(?:caught|got|landed|got|had|took|pulled)\s+(?:(\d+)|several|a few|multiple|good|well|plenty).*?(?:fish|snapper|kahawai|kingfish|cod|bream|flatfish)?', re.I)
+_SIZE_RE = re.compile(r'(\d+)\s*(?:cm|mm|kg|lbs?|pound).*?(?:fish|snapper|kahawai|kingfish)', re.I)
+_QUALITY_WORDS = ['excellent', 'great', 'amazing', 'good', 'okay', 'slow', 'poor', 'fantastic', 'productive']
+_QUALITY_RE = re.compile(rf"({'|'.join(_QUALITY_WORDS)})\s+(?:fishing|catch|bite|session|day)", re.I)
+_START_RE = re.compile(r'start=(\d+)')
+_WORD_RE = re.compile(r'\w+')
+
+# A post needs at least two of these to count as fishing-related
+FISHING_KEYWORDS = (
+    'fish', 'catch', 'caught', 'fishing', 'bite', 'rod', 'line',
+    'bait', 'lure', 'snapper', 'kahawai', 'kingfish', 'spot',
+    'water', 'sea', 'bay', 'reef', 'tide', 'wind', 'weather'
+)
+
+# Thin wrappers so the extraction code works with either parse tree
+def _parse_html(page_source):
+    """Parse HTML with selectolax if available, otherwise BeautifulSoup"""
+    if SELECTOLAX_AVAILABLE:
+        return LexborHTMLParser(page_source)
+    from bs4 import BeautifulSoup
+    return BeautifulSoup(page_source, HTML_PARSER)
+
+def _css(tree, selector):
+    """All nodes matching a CSS selector"""
+    return tree.css(selector) if SELECTOLAX_AVAILABLE else tree.select(selector)
+
+def _css_first(tree, selector):
+    """First node matching a CSS selector, or None"""
+    return tree.css_first(selector) if SELECTOLAX_AVAILABLE else tree.select_one(selector)
+
+def _node_text(node):
+    """Text content of a node"""
+    return node.text() if SELECTOLAX_AVAILABLE else node.get_text()
+
+def _node_attr(node, name):
+    """Attribute value of a node, or None"""
+    return node.attributes.get(name) if SELECTOLAX_AVAILABLE else node.get(name)
+
+
+# Common forum post containers, tried in order
+POST_SELECTORS = (
+    'div.post',
+    'div.message',
+    'article.post',
+    'div[data-post]',
+    'div.entry',
+    'div.forum-post',
+    'li.post-item',
+    'div.topic-post'
+)
+
+# Last-resort post containers when none of the known forum selectors match
+FALLBACK_POST_SELECTOR = 'div[class*=post i], div[class*=message i], div[class*=comment i], div[class*=entry i]'
+
+def _usable_posts(candidates, limit=50):
+    """Text of up to `limit` candidates with enough text to be a real post
+    
+    Very small matches are usually navigation elements. Each node's text is
+    extracted exactly once here and handed on, so the tree isn't walked again
+    when the post is parsed. Stops scanning once `limit` posts are found.
+    """
+    posts = []
+    for node in candidates:
+        text = _node_text(node)
+        if len(text.strip()) > 100:
+            posts.append(text)
+            if len(posts) == limit:
+                break
+    return posts
+
+def _is_word_char(char):
+    return char.isalnum() or char == '_'
+
+def _is_whole_word(text, start, end, allow_plural=False):
+    """True if text[start:end + 1] isn't part of a longer word"""
+    if start > 0 and _is_word_char(text[start - 1]):
+        return False
+    after = end + 1
+    if allow_plural and after < len(text) and text[after] == 's':
+        after += 1
+    return after >= len(text) or not _is_word_char(text[after])
+
+@lru_cache(maxsize=256)
+def _host(url):
+    """Network location of a URL (cached; called once per page)"""
+    return urlparse(url).netloc
+
+# Static usage notes appended to every generated forum markdown file
+_FOOTER_MD = (
+    "### How to Use This Data\n"
+    "1. This data was automatically extracted from forum posts\n"
+    "2. Review the source links for full context\n"
+    "3. Verify catches and conditions match your experience\n"
+    "4. Edit this file to add manual validation notes\n\n"
+)
+
+# Append-only log of every scraped report; markdown files are rendered from it
+REPORTS_JSONL = Path("fishing_reports") / "reports.jsonl"
+
+# Upper bound on concurrent Chrome instances (each one is a few hundred MB)
+MAX_BROWSERS = 4
+
+# Persistent Chrome profiles live here, beside this module unless NAV_CACHE_DIR says otherwise
+CACHE_DIR = os.environ.get("NAV_CACHE_DIR") or os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+
+# Resource URL patterns the browser is told not to fetch
+BLOCKED_RESOURCE_URLS = ['*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+                         '*.woff', '*.woff2', '*.ttf', '*.css', '*.mp4']
+
+
+def _try_lock(path):
+    """Open `path` and lock it exclusively without blocking; the open file, or None if it's held"""
+    handle = open(path, 'a+')
+    try:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+    except OSError:
+        handle.close()
+        return None
+    return handle
+
+
+class BrowserPool:
+    """Fixed-size pool of browsers shared between scraping threads
+    
+    Browsers are started lazily, one at a time (undetected_chromedriver patches
+    its driver binary on startup), up to `size`. Once all are busy, acquire()
+    blocks until another thread releases one.
+    """
+    
+    def __init__(self, factory, size=1):
+        self.factory = factory
+        self.size = size
+        self._idle = queue.Queue()
+        self._browsers = []
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Get an idle browser, starting a new one if the pool isn't full"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            if len(self._browsers) < self.size:
+                browser = self.factory()
+                self._browsers.append(browser)
+                return browser
+        
+        return self._idle.get()
+    
+    def release(self, browser):
+        """Return a browser to the pool"""
+        self._idle.put(browser)
+    
+    def close(self):
+        """Quit every browser the pool started"""
+        with self._lock:
+            for browser in self._browsers:
+                try:
+                    browser.quit()
+                except:
+                    pass
+            self._browsers = []
+            self._idle = queue.Queue()
 
-import undetected_chromedriver as uc
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
 class FishingForumScraper:
     """Scrape fishing reports from forum URLs using browser automation"""
     
-    def __init__(self):
-        self.browser = None
+    def __init__(self, pool_size=1):
+        self.pool = BrowserPool(self._create_browser, size=pool_size)
         self.debug_mode = False  # Debug flag for showing unmatched posts
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -43,6 +268,17 @@ class FishingForumScraper:
             'Pragma': 'no-cache'
         }
         
+        # Lock files held for claimed profile slots, and temp profiles to delete, until close
+        self._profile_locks = []
+        self._temp_profiles = []
+        
+        # Winning post selector per forum host (see _extract_posts)
+        self._selector_cache = {}
+        
+        # Plain HTTP session for server-rendered pages (no browser needed)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        
         # Location keywords to extract/organize reports by
         self.location_keywords = {
             'wellington': ['wellington', 'lyall', 'oriental', 'baring', 'barrett', 'south coast'],
@@ -60,11 +296,51 @@ class FishingForumScraper:
             'flatfish', 'bream', 'flounder', 'yellow tail', 'john dory',
             'crayfish', 'rock lobster', 'kina', 'paua'
         ]
+        
+        # Single-word species are found by set intersection with the post's
+        # words; the few multi-word names use one small alternation. Matching
+        # whole words stops hits inside other words ("kina" in "kinase").
+        self._species_single = frozenset(sp for sp in self.species if ' ' not in sp)
+        self._species_multi_re = re.compile(
+            r'\b(' + '|'.join(re.escape(sp) for sp in self.species if ' ' in sp) + r')s?\b'
+        )
+        location_terms = [(kw, loc) for loc, kws in self.location_keywords.items() for kw in kws]
+        # keyword -> (priority, location); earlier locations in the dict win
+        self._location_by_keyword = {kw: (i, loc) for i, (kw, loc) in enumerate(location_terms)}
+        # Single-word keywords are looked up per word; multi-word ones
+        # ("south coast", "mana island") use a small alternation
+        self._location_multi_re = re.compile(
+            r'\b(' + '|'.join(re.escape(kw) for kw in self._location_by_keyword if ' ' in kw) + r')\b'
+        )
+        
+        # All three keyword sets in one automaton, so a post is scanned once
+        self._keyword_automaton = self._build_keyword_automaton()
     
-    def _init_browser(self):
-        """Initialize undetected Chrome browser for scraping Cloudflare-protected sites"""
-        if self.browser:
-            return  # Already initialized
+    def _build_keyword_automaton(self):
+        """Map each keyword to the (category, keyword) pairs it belongs to"""
+        if not AHOCORASICK_AVAILABLE:
+            return None
+        
+        entries = {}
+        for category, keywords in (('fishing', FISHING_KEYWORDS),
+                                   ('species', self.species),
+                                   ('location', self._location_by_keyword)):
+            for keyword in keywords:
+                entries.setdefault(keyword, []).append((category, keyword))
+        
+        automaton = ahocorasick.Automaton()
+        for keyword, value in entries.items():
+            automaton.add_word(keyword, tuple(value))
+        automaton.make_automaton()
+        return automaton
+    
+    def _create_browser(self):
+        """Start an undetected Chrome browser for scraping Cloudflare-protected sites"""
+        try:
+            import undetected_chromedriver as uc
+        except ImportError:
+            print("   ❌ Browser scraping needs: pip install undetected-chromedriver selenium")
+            raise
         
         try:
             print("   🌐 Starting undetected browser...")
@@ -76,40 +352,94 @@ class FishingForumScraper:
             options.add_argument('--disable-dev-shm-usage')
             options.add_argument(f'User-Agent={self.headers["User-Agent"]}')
             
+            # Text-only scraping: skip images and return once the DOM is ready
+            options.add_argument('--blink-settings=imagesEnabled=false')
+            options.add_argument(f'--disk-cache-size={50 * 1024 * 1024}')
+            options.page_load_strategy = 'eager'
+            
+            profile_dir = self._claim_profile_dir()
+            
             # undetected_chromedriver handles the driver installation automatically
-            self.browser = uc.Chrome(options=options, version_main=None, no_sandbox=True)
+            browser = uc.Chrome(options=options, version_main=None, no_sandbox=True,
+                                user_data_dir=profile_dir)
+            
+            # Don't download resources that never affect the post text
+            browser.execute_cdp_cmd('Network.enable', {})
+            browser.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_RESOURCE_URLS})
             print("   ✅ Undetected browser ready (bypasses Cloudflare)")
+            return browser
         except Exception as e:
             print(f"   ❌ Failed to start browser: {e}")
             raise
     
+    def _claim_profile_dir(self):
+        """Chrome profile directory for a new browser
+        
+        Profiles persist between runs so Cloudflare clearance cookies survive.
+        Chrome can't share an open profile, so each browser claims one of
+        MAX_BROWSERS slots by locking its lock file (released when the lock
+        file is closed, or the process dies). A temporary profile is only used
+        when every slot is taken, e.g. by another run.
+        """
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        for slot in range(MAX_BROWSERS):
+            profile_dir = os.path.join(CACHE_DIR, f"uc_profile_{slot}")
+            lock = _try_lock(profile_dir + ".lock")
+            if lock is not None:
+                self._profile_locks.append(lock)
+                return profile_dir
+        
+        profile_dir = tempfile.mkdtemp(prefix="uc_profile_")
+        self._temp_profiles.append(profile_dir)
+        return profile_dir
+    
     def _close_browser(self):
-        """Close the Selenium browser"""
-        if self.browser:
-            try:
-                self.browser.quit()
-                self.browser = None
-            except:
-                pass
+        """Close all Selenium browsers and release their profiles"""
+        self.pool.close()
+        for lock in self._profile_locks:
+            lock.close()
+        for profile_dir in self._temp_profiles:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+        self._profile_locks = []
+        self._temp_profiles = []
     
-    def _get_page_content(self, url, wait_for_selector=None, wait_seconds=10):
-        """Get page content using Selenium browser"""
+    def _fetch_static(self, url):
+        """Fetch a page over plain HTTP; None if it's blocked or needs a browser"""
         try:
-            self.browser.get(url)
+            response = self.session.get(url, timeout=15)
+        except requests.RequestException:
+            return None
+        
+        # Cloudflare challenge / bot block - only a real browser gets through
+        if response.status_code in (403, 503) or 'cf-mitigated' in response.headers:
+            return None
+        if not response.ok or 'Just a moment...' in response.text:
+            return None
+        return response.text
+    
+    def _get_page_content(self, browser, url, wait_for_selector=None, wait_seconds=10):
+        """Get page content using a Selenium browser"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.common.exceptions import TimeoutException
+        
+        try:
+            browser.get(url)
             
             # Wait for content to load
             if wait_for_selector:
                 try:
-                    WebDriverWait(self.browser, wait_seconds).until(
+                    WebDriverWait(browser, wait_seconds).until(
                         EC.presence_of_all_elements_located((By.CSS_SELECTOR, wait_for_selector))
                     )
                 except TimeoutException:
                     print(f"   ⚠️  Timeout waiting for content selector")
             else:
-                # Generic wait for page to load
-                time.sleep(2)
+                # Page loads are 'eager', so the DOM is already there; give scripts a moment
+                time.sleep(0.3)
             
-            return self.browser.page_source
+            return browser.page_source
         except Exception as e:
             print(f"   ❌ Browser error: {e}")
             return None
@@ -118,108 +448,151 @@ class FishingForumScraper:
         """Scrape a forum URL and extract fishing reports from ALL pages"""
         
         print(f"\n🌐 Scraping: {url}")
+        
+        all_reports = self._scrape_pages(url)
+        
+        print(f"📊 Total: Extracted {len(all_reports)} fishing reports from all pages")
+        return all_reports
+    
+    def _fetch_page(self, url, browser):
+        """Fetch with the browser if we have one, otherwise over plain HTTP"""
+        if browser is None:
+            return self._fetch_static(url)
+        # Only wait on a selector this forum is known to use: a page without it
+        # (JS shell, guessed page URL) would otherwise sit out the whole timeout
+        wait_for = self._selector_cache.get(_host(url))
+        return self._get_page_content(browser, url, wait_for_selector=wait_for)
+    
+    def _parse_page(self, page_source, url):
+        """Parse fetched HTML into (tree, posts), or (None, []) if nothing was fetched
+        
+        The caller never keeps page_source, so the raw HTML string is freed as
+        soon as it has been parsed instead of living alongside the tree.
+        LexborHTMLParser also keeps its own bytes copy in raw_html; nothing
+        here reads it back, so that copy is dropped too.
+        """
+        if not page_source:
+            return None, []
+        tree = _parse_html(page_source)
+        if SELECTOLAX_AVAILABLE:
+            tree.raw_html = b''
+        # Extract forum posts - try different common selectors
+        return tree, self._extract_posts(tree, url)
+    
+    def _scrape_pages(self, url):
+        """Follow pagination from `url` and return its reports
+        
+        Pages are fetched over plain HTTP while that works. A browser is only
+        taken from the pool once a page is blocked, or the first page has no
+        posts (likely rendered by JavaScript). It is then kept for the rest of
+        the thread. Each next page is fetched in the background while the
+        current page's posts are parsed.
+        """
         all_reports = []
         current_url = url
         page_count = 0
         max_pages = 20  # Safety limit to avoid infinite loops
+        browser = None
+        prefetch = None
         
-        while current_url and page_count < max_pages:
-            page_count += 1
-            print(f"   📄 Page {page_count}: {current_url}")
-            
-            try:
-                # Initialize browser on first run
-                if not self.browser:
-                    self._init_browser()
-                
-                # Get page content using browser
-                page_source = self._get_page_content(current_url, wait_for_selector='div')
-                
-                if not page_source:
-                    print(f"   ❌ Failed to load page {page_count}")
-                    break
-                
-                soup = BeautifulSoup(page_source, 'html.parser')
-                
-                # Extract forum posts - try different common selectors
-                posts = self._extract_posts(soup)
-                
-                if not posts:
-                    print(f"   ⚠️  No posts found on page {page_count}")
-                    break
-                
-                print(f"   ✅ Found {len(posts)} posts on page {page_count}")
-                
-                # Parse each post for fishing information
-                page_reports = []
-                for post in posts:
-                    report = self._parse_fishing_report(post, current_url)
-                    if report:
-                        page_reports.append(report)
-                
-                print(f"   📊 Extracted {len(page_reports)} fishing reports from page {page_count}")
-                all_reports.extend(page_reports)
-                
-                # Find next page
-                next_url = self._find_next_page_url(soup, current_url)
-                if next_url:
-                    print(f"   ➡️  Found next page link")
-                    current_url = next_url
-                else:
-                    print(f"   ✋ No more pages found")
-                    break
-                
-            except Exception as e:
-                print(f"   ❌ Error on page {page_count}: {e}")
-                break
+        try:
+            # Exiting the executor waits for any in-flight prefetch, so the
+            # browser is idle again before it goes back to the pool
+            with ThreadPoolExecutor(max_workers=1) as prefetcher:
+                while current_url and page_count < max_pages:
+                    page_count += 1
+                    print(f"   📄 Page {page_count}: {current_url}")
+                    
+                    try:
+                        # The page may already have been fetched during the previous iteration
+                        if prefetch is not None:
+                            tree, posts = self._parse_page(prefetch.result(), current_url)
+                            prefetch = None
+                        else:
+                            tree, posts = self._parse_page(self._fetch_page(current_url, browser), current_url)
+                        
+                        # Later pages with no posts are just the end of the thread
+                        if browser is None and (tree is None or (not posts and page_count == 1)):
+                            browser = self.pool.acquire()
+                            tree, posts = self._parse_page(self._fetch_page(current_url, browser), current_url)
+                        
+                        if tree is None:
+                            print(f"   ❌ Failed to load page {page_count}")
+                            break
+                        
+                        if not posts:
+                            print(f"   ⚠️  No posts found on page {page_count}")
+                            break
+                        
+                        print(f"   ✅ Found {len(posts)} posts on page {page_count}")
+                        
+                        # Find next page and start loading it before parsing this one
+                        next_url = self._find_next_page_url(tree, current_url)
+                        if next_url and page_count < max_pages:
+                            prefetch = prefetcher.submit(self._fetch_page, next_url, browser)
+                        
+                        # Parse each post for fishing information
+                        page_reports = []
+                        for post in posts:
+                            report = self._parse_fishing_report(post, current_url)
+                            if report:
+                                page_reports.append(report)
+                        
+                        print(f"   📊 Extracted {len(page_reports)} fishing reports from page {page_count}")
+                        all_reports.extend(page_reports)
+                        
+                        if next_url:
+                            print(f"   ➡️  Found next page link")
+                            current_url = next_url
+                        else:
+                            print(f"   ✋ No more pages found")
+                            break
+                        
+                    except Exception as e:
+                        print(f"   ❌ Error on page {page_count}: {e}")
+                        break
+        finally:
+            if browser is not None:
+                self.pool.release(browser)
         
         if page_count > 1:
             print(f"\n✅ Scraped {page_count} pages total")
         
-        print(f"📊 Total: Extracted {len(all_reports)} fishing reports from all pages")
         return all_reports
     
-    def _extract_posts(self, soup):
-        """Extract forum posts from various forum software"""
+    def _extract_posts(self, tree, url):
+        """Extract the text of forum posts from various forum software"""
         
-        posts = []
+        # Pages from the same forum share markup, so try the selector that
+        # worked last time for this host before the rest
+        host = _host(url)
+        preferred = self._selector_cache.get(host)
+        selectors = POST_SELECTORS
+        if preferred:
+            selectors = (preferred,) + tuple(sel for sel in POST_SELECTORS if sel != preferred)
         
         # Try common forum selectors
-        selectors = [
-            'div.post',
-            'div.message',
-            'article.post',
-            'div[data-post]',
-            'div.entry',
-            'div.forum-post',
-            'li.post-item',
-            'div.topic-post'
-        ]
-        
         for selector in selectors:
-            candidates = soup.select(selector)
-            # Filter out very small posts (likely navigation elements)
-            posts = [p for p in candidates if len(p.get_text().strip()) > 100]
+            posts = _usable_posts(_css(tree, selector))
             if posts:
-                return posts[:50]  # Limit to 50 posts to avoid huge scrapes
+                self._selector_cache[host] = selector
+                return posts
         
-        # Fallback: get all divs with significant text content
-        all_divs = soup.find_all('div', class_=re.compile('post|message|comment|entry', re.I))
-        posts = [p for p in all_divs if len(p.get_text().strip()) > 100]
-        return posts[:50] if posts else []
+        # Fallback: get divs with significant text content (bounded, since
+        # this matches a lot of layout on pages where no selector hit)
+        return _usable_posts(_css(tree, FALLBACK_POST_SELECTOR)[:200])
     
-    def _find_next_page_url(self, soup, current_url):
+    def _find_next_page_url(self, tree, current_url):
         """Find the next page URL in forum pagination"""
         
         # Strategy 1: Look for rel="next" link (HTML5 standard)
-        next_link = soup.find('link', {'rel': 'next'})
-        if next_link and next_link.get('href'):
-            return self._resolve_url(next_link['href'], current_url)
+        next_link = _css_first(tree, 'link[rel~="next"]')
+        if next_link and _node_attr(next_link, 'href'):
+            return self._resolve_url(_node_attr(next_link, 'href'), current_url)
         
         # Strategy 2: Look for "Next" button/link
         next_selectors = [
             'a[rel="next"]',
-            'a:contains("Next")',
             'a.next-page',
             'a[title="Next"]',
             'li.next > a',
@@ -229,24 +602,29 @@ class FishingForumScraper:
         
         for selector in next_selectors:
             try:
-                next_elem = soup.select_one(selector)
-                if next_elem and next_elem.get('href'):
-                    return self._resolve_url(next_elem['href'], current_url)
+                next_elem = _css_first(tree, selector)
+                if next_elem and _node_attr(next_elem, 'href'):
+                    return self._resolve_url(_node_attr(next_elem, 'href'), current_url)
             except:
                 pass
         
+        # Links whose text says "Next" (lexbor has no :contains pseudo-class)
+        for link in _css(tree, 'a[href]'):
+            if 'Next' in _node_text(link):
+                return self._resolve_url(_node_attr(link, 'href'), current_url)
+        
         # Strategy 3: Look for numbered pagination and find next number
-        page_links = soup.select('a[href*="start="], a[href*="page="], a[href*="p="]')
+        page_links = _css(tree, 'a[href*="start="], a[href*="page="], a[href*="p="]')
         if page_links:
             # Extract page numbers from URLs
             for link in page_links:
-                href = link.get('href', '')
+                href = _node_attr(link, 'href') or ''
                 # Extract the page/start parameter
                 if 'start=' in href:
-                    match = re.search(r'start=(\d+)', href)
+                    match = _START_RE.search(href)
                     if match:
                         start_num = int(match.group(1))
-                        current_match = re.search(r'start=(\d+)', current_url)
+                        current_match = _START_RE.search(current_url)
                         if current_match:
                             current_start = int(current_match.group(1))
                             if start_num > current_start:
@@ -258,12 +636,12 @@ class FishingForumScraper:
         
         # Strategy 4: Check for common pagination patterns (like &start=20, &start=40, etc)
         if 'start=' in current_url:
-            match = re.search(r'start=(\d+)', current_url)
+            match = _START_RE.search(current_url)
             posts_per_page = 20  # Common default
             if match:
                 current_start = int(match.group(1))
                 next_start = current_start + posts_per_page
-                next_url = re.sub(r'start=\d+', f'start={next_start}', current_url)
+                next_url = _START_RE.sub(f'start={next_start}', current_url)
                 return next_url
         elif '?' in current_url and 'start' not in current_url:
             # Add pagination parameter
@@ -288,10 +666,8 @@ class FishingForumScraper:
             else:
                 return base_without_query + '/' + href
     
-    def _parse_fishing_report(self, post_element, post_url):
-        """Extract fishing information from a single post"""
-        
-        text = post_element.get_text()
+    def _parse_fishing_report(self, text, post_url):
+        """Extract fishing information from a single post's text"""
         
         # Skip posts that are too short
         if len(text) < 50:
@@ -299,20 +675,22 @@ class FishingForumScraper:
                 print(f"      [DEBUG] Post too short ({len(text)} chars)")
             return None
         
-        # Check if post mentions fishing/fish
-        if not self._contains_fishing_keywords(text):
+        # Lowercase once; every extractor below works on this copy
+        text_lower = text.lower()
+        
+        # Check if post mentions fishing/fish, and pick out location and species
+        is_fishing, location, species_found = self._scan_keywords(text_lower)
+        if not is_fishing:
             if self.debug_mode:
                 snippet = text[:100].replace('\n', ' ')
                 print(f"      [DEBUG] No fishing keywords: {snippet}...")
             return None
         
         # Extract key information
-        location = self._extract_location(text)
         if not location:
             location = 'General'
         
-        species_found = self._extract_species(text)
-        conditions = self._extract_conditions(text)
+        conditions = self._extract_conditions(text_lower)
         catch_info = self._extract_catch_info(text)
         
         # Skip if minimal info
@@ -335,60 +713,76 @@ class FishingForumScraper:
         
         return report
     
-    def _contains_fishing_keywords(self, text):
-        """Check if post is about fishing"""
-        keywords = [
-            'fish', 'catch', 'caught', 'fishing', 'bite', 'rod', 'line',
-            'bait', 'lure', 'snapper', 'kahawai', 'kingfish', 'spot',
-            'water', 'sea', 'bay', 'reef', 'tide', 'wind', 'weather'
-        ]
-        text_lower = text.lower()
-        return sum(1 for k in keywords if k in text_lower) >= 2
-    
-    def _extract_location(self, text):
-        """Extract location name from text"""
-        text_lower = text.lower()
+    def _scan_keywords(self, text_lower):
+        """Return (is_fishing, location, species) for a post
         
-        for location, keywords in self.location_keywords.items():
-            for keyword in keywords:
-                if keyword in text_lower:
-                    return location.replace('_', ' ').title()
+        Uses one Aho-Corasick pass when pyahocorasick is installed, otherwise
+        the per-category extractors below. Both give the same results:
+        fishing keywords match anywhere, species and locations only as whole
+        words (species may take a plural "s").
+        """
+        if self._keyword_automaton is None:
+            if not self._contains_fishing_keywords(text_lower):
+                return False, None, []
+            return True, self._extract_location(text_lower), self._extract_species(text_lower)
+        
+        fishing, species, locations = set(), set(), set()
+        for end, entries in self._keyword_automaton.iter(text_lower):
+            for category, keyword in entries:
+                if category == 'fishing':
+                    fishing.add(keyword)
+                elif _is_whole_word(text_lower, end - len(keyword) + 1, end,
+                                    allow_plural=(category == 'species')):
+                    (species if category == 'species' else locations).add(keyword)
+        
+        if len(fishing) < 2:
+            return False, None, []
+        
+        location = None
+        if locations:
+            _, location = min(self._location_by_keyword[kw] for kw in locations)
+            location = location.replace('_', ' ').title()
+        
+        return True, location, sorted(sp.title() for sp in species)
+    
+    def _contains_fishing_keywords(self, text_lower):
+        """Check if post is about fishing (at least two keywords)"""
+        hits = 0
+        for keyword in FISHING_KEYWORDS:
+            if keyword in text_lower:
+                hits += 1
+                if hits >= 2:
+                    return True
+        return False
+    
+    def _extract_location(self, text_lower):
+        """Extract location name from lowercased text"""
+        hits = [self._location_by_keyword[kw] for kw in self._location_multi_re.findall(text_lower)]
+        hits.extend(self._location_by_keyword[word] for word in set(_WORD_RE.findall(text_lower))
+                    if word in self._location_by_keyword)
+        if hits:
+            _, location = min(hits)
+            return location.replace('_', ' ').title()
         
         return None
     
-    def _extract_species(self, text):
+    def _extract_species(self, text_lower):
         """Extract fish species mentioned"""
-        found = []
-        text_lower = text.lower()
+        words = set(_WORD_RE.findall(text_lower))
+        # Allow simple plurals ("snappers")
+        words.update([word[:-1] for word in words if word.endswith('s')])
         
-        for species in self.species:
-            if species in text_lower:
-                found.append(species.title())
-        
-        return list(set(found))  # Remove duplicates
+        found = words & self._species_single
+        found.update(self._species_multi_re.findall(text_lower))
+        return sorted(species.title() for species in found)
     
-    def _extract_conditions(self, text):
+    def _extract_conditions(self, text_lower):
         """Extract weather/conditions mentioned"""
         conditions = []
         
-        condition_patterns = {
-            'Wind': [r'(north|south|east|west|calm|light|strong|building|shifting)\s*(wind|breeze|northerly|southerly|easterly|westerly|northerlies|southerlies)',
-                    r'(\d+)\s*kt.*?(wind|breeze)',
-                    r'(calm|light|moderate|strong|gusty|shifty|variable)\s*(conditions|wind)'],
-            'Tide': [r'(slack|running|strong|ebbing|flowing|flood|ebb)\s*(tide|water)',
-                    r'(incoming|outgoing|high|low)\s*tide',
-                    r'tide.*?(running|slack|strong|weak)'],
-            'Sea State': [r'(smooth|calm|rough|choppy|lumpy|swell)\s*(sea|conditions|water)',
-                         r'(\d+).*?(metre|foot).*?(wave|swell)'],
-            'Weather': [r'(sunny|cloudy|overcast|rainy|clear|misty|foggy).*?(conditions|morning|afternoon)',
-                       r'(clear skies|good weather|poor conditions)']
-        }
-        
-        text_lower = text.lower()
-        
-        for condition_type, patterns in condition_patterns.items():
+        for condition_type, patterns in _CONDITION_RES.items():
             for pattern in patterns:
-                matches = re.findall(pattern, text_lower, re.IGNORECASE)
+                matches = pattern.findall(text_lower)
                 if matches:
                     conditions.append(f"{condition_type}: {matches[0] if isinstance(matches[0], str) else ' '.join(matches[0])}")
                     break
@@ -400,26 +794,64 @@ class FishingForumScraper:
         catch = []
         
         # Look for catch counts
-        count_pattern = r'(?:caught|got|landed|got|had|took|pulled)\s+(?:(\d+)|several|a few|multiple|good|well|plenty).*?(?:fish|snapper|kahawai|kingfish|cod|bream|flatfish)?'
-        matches = re.findall(count_pattern, text, re.IGNORECASE)
+        matches = _COUNT_RE.findall(text)
         if matches:
             catch.append(f"Multiple fish landed")
         
         # Look for size mentions
-        size_pattern = r'(\d+)\s*(?:cm|mm|kg|lbs?|pound).*?(?:fish|snapper|kahawai|kingfish)'
-        matches = re.findall(size_pattern, text, re.IGNORECASE)
+        matches = _SIZE_RE.findall(text)
         if matches:
             catch.append(f"Fish sizes: {', '.join(set(matches))} cm/kg")
         
         # Look for quality descriptors
-        quality = ['excellent', 'great', 'amazing', 'good', 'okay', 'slow', 'poor', 'fantastic', 'productive']
-        quality_pattern = rf"({'|'.join(quality)})\s+(?:fishing|catch|bite|session|day)"
-        if re.search(quality_pattern, text, re.IGNORECASE):
-            match = re.search(quality_pattern, text, re.IGNORECASE)
+        match = _QUALITY_RE.search(text)
+        if match:
             catch.append(f"Session quality: {match.group(1)}")
         
         return catch
     
+    def save_reports_to_jsonl(self, reports, path=REPORTS_JSONL):
+        """Append reports to the JSONL log, one compact JSON object per line"""
+        
+        if not reports:
+            return 0
+        
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        if ORJSON_AVAILABLE:
+            with open(path, 'ab') as f:
+                f.writelines(orjson.dumps(report) + b'\n' for report in reports)
+        else:
+            with open(path, 'a', encoding='utf-8') as f:
+                f.writelines(json.dumps(report, separators=(',', ':')) + '\n' for report in reports)
+        
+        print(f"💾 Appended {len(reports)} reports to {path}")
+        return len(reports)
+    
+    def load_reports_from_jsonl(self, path=REPORTS_JSONL):
+        """Read reports back from the JSONL log, skipping repeats of the same post"""
+        
+        if not path.exists():
+            return []
+        
+        reports = []
+        seen = set()
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                report = json.loads(line)
+                # The same thread may be scraped on several runs
+                key = (report['source_url'], report['post_snippet'])
+                if key not in seen:
+                    seen.add(key)
+                    reports.append(report)
+        return reports
+    
+    def render_markdown_from_jsonl(self, path=REPORTS_JSONL):
+        """Rebuild the per-location markdown files from the JSONL log"""
+        return self.save_reports_to_files(self.load_reports_from_jsonl(path))
+    
     def save_reports_to_files(self, reports):
         """Save extracted reports to markdown files"""
         
@@ -430,6 +862,11 @@ class FishingForumScraper:
         fishing_reports_dir = Path("fishing_reports")
         fishing_reports_dir.mkdir(parents=True, exist_ok=True)
         
+        # One timestamp for the whole save, shared by every file
+        now = datetime.now()
+        now_str = now.strftime('%Y-%m-%d %H:%M:%S')
+        now_iso = now.isoformat()
+        
         # Group reports by location
         by_location = {}
         for report in reports:
@@ -438,33 +875,43 @@ class FishingForumScraper:
                 by_location[loc] = []
             by_location[loc].append(report)
         
-        created = 0
-        
-        for location, location_reports in by_location.items():
-            # Create one file per location with all reports
-            filename = f"{location.upper().replace(' ', '_')}_FORUM.md"
-            filepath = fishing_reports_dir / filename
-            
-            markdown = self._create_markdown_from_reports(location, location_reports)
-            
-            try:
-                with open(filepath, 'w', encoding='utf-8') as f:
-                    f.write(markdown)
-                print(f"✅ Created {filepath.name} ({len(location_reports)} reports)")
-                created += 1
-            except Exception as e:
-                print(f"❌ Error creating {filepath.name}: {e}")
+        # One file per location; writes are independent and I/O bound, so overlap them
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(self._write_one_file, location, location_reports,
+                                fishing_reports_dir, now_str, now_iso)
+                for location, location_reports in by_location.items()
+            ]
+            created = sum(1 for future in futures if future.result())
         
         return created
     
-    def _create_markdown_from_reports(self, location, reports):
+    def _write_one_file(self, location, reports, fishing_reports_dir, now_str, now_iso):
+        """Write one location's markdown file; True on success"""
+        filename = f"{location.upper().replace(' ', '_')}_FORUM.md"
+        filepath = fishing_reports_dir / filename
+        
+        markdown = self._create_markdown_from_reports(location, reports, now_str, now_iso)
+        
+        try:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(markdown)
+            print(f"✅ Created {filepath.name} ({len(reports)} reports)")
+            return True
+        except Exception as e:
+            print(f"❌ Error creating {filepath.name}: {e}")
+            return False
+    
+    def _create_markdown_from_reports(self, location, reports, now_str, now_iso):
         """Convert multiple reports to markdown format"""
         
-        markdown = f"## {location.upper()}\n\n"
-        markdown += f"### Forum Source Data\n"
-        markdown += f"- Scraped: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
-        markdown += f"- Total Reports: {len(reports)}\n"
-        markdown += f"- Source URLs: {len(set(r['source_url'] for r in reports))} forum threads\n\n"
+        parts = [
+            f"## {location.upper()}\n\n",
+            "### Forum Source Data\n",
+            f"- Scraped: {now_str}\n",
+            f"- Total Reports: {len(reports)}\n",
+            f"- Source URLs: {len(set(r['source_url'] for r in reports))} forum threads\n\n"
+        ]
         
         # Compile aggregate information
         all_species = set()
@@ -477,57 +924,51 @@ class FishingForumScraper:
             all_catches.update(report['catch_info'])
         
         # Summary section
-        markdown += "### Species Reported\n"
+        parts.append("### Species Reported\n")
         if all_species:
-            for species in sorted(all_species):
-                markdown += f"- {species}\n"
+            parts.extend(f"- {species}\n" for species in sorted(all_species))
         else:
-            markdown += "- Various (details in forum posts)\n"
-        markdown += "\n"
+            parts.append("- Various (details in forum posts)\n")
+        parts.append("\n")
         
-        markdown += "### Conditions Mentioned\n"
+        parts.append("### Conditions Mentioned\n")
         if all_conditions:
-            for condition in sorted(all_conditions)[:10]:  # Top 10
-                markdown += f"- {condition}\n"
+            parts.extend(f"- {condition}\n" for condition in sorted(all_conditions)[:10])  # Top 10
         else:
-            markdown += "- Variable conditions\n"
-        markdown += "\n"
+            parts.append("- Variable conditions\n")
+        parts.append("\n")
         
         # Individual reports
-        markdown += "### Recent Forum Reports\n\n"
+        parts.append("### Recent Forum Reports\n\n")
         
         for i, report in enumerate(reports[:20], 1):  # Top 20 reports
-            markdown += f"**Report {i}**: {report['post_snippet'][:100]}...\n"
+            parts.append(f"**Report {i}**: {report['post_snippet'][:100]}...\n")
             
             if report['species']:
-                markdown += f"  - Species: {', '.join(report['species'][:3])}\n"
+                parts.append(f"  - Species: {', '.join(report['species'][:3])}\n")
             
             if report['conditions']:
-                markdown += f"  - Conditions: {', '.join(report['conditions'][:2])}\n"
+                parts.append(f"  - Conditions: {', '.join(report['conditions'][:2])}\n")
             
             if report['catch_info']:
-                markdown += f"  - Catch: {', '.join(report['catch_info'][:2])}\n"
+                parts.append(f"  - Catch: {', '.join(report['catch_info'][:2])}\n")
             
-            markdown += f"  - Source: [Link]({report['source_url']})\n\n"
+            parts.append(f"  - Source: [Link]({report['source_url']})\n\n")
         
-        markdown += "### How to Use This Data\n"
-        markdown += "1. This data was automatically extracted from forum posts\n"
-        markdown += "2. Review the source links for full context\n"
-        markdown += "3. Verify catches and conditions match your experience\n"
-        markdown += "4. Edit this file to add manual validation notes\n\n"
+        parts.append(_FOOTER_MD)
         
-        markdown += f"### Raw Data (JSON)\n"
-        markdown += "```json\n"
-        markdown += json.dumps({
+        parts.append("### Raw Data (JSON)\n")
+        parts.append("```json\n")
+        parts.append(json.dumps({
             'location': location,
             'report_count': len(reports),
             'species': list(all_species),
             'conditions': list(all_conditions),
-            'scraped_date': datetime.now().isoformat()
-        }, indent=2)
-        markdown += "\n```\n"
+            'scraped_date': now_iso
+        }, indent=2))
+        parts.append("\n```\n")
         
-        return markdown
+        return "".join(parts)
 
 
 def main():
@@ -538,11 +979,16 @@ def main():
     parser.add_argument('--file', help='Text file with forum URLs (one per line)')
     parser.add_argument('--urls', nargs='+', help='Multiple URLs as arguments')
     parser.add_argument('--debug', action='store_true', help='Show debug info about posts not matched')
+    parser.add_argument('--no-md', action='store_true', help=f'Only append reports to {REPORTS_JSONL}, skip markdown')
+    parser.add_argument('--render-md', action='store_true', help=f'Rebuild markdown files from {REPORTS_JSONL} without scraping')
     
     args = parser.parse_args()
     
-    scraper = FishingForumScraper()
-    scraper.debug_mode = args.debug  # Add debug flag
+    if args.render_md:
+        created = FishingForumScraper().render_markdown_from_jsonl()
+        print(f"\n✅ Rendered {created} report file(s) from {REPORTS_JSONL}")
+        return
+    
     all_reports = []
     
     urls_to_scrape = []
@@ -585,10 +1031,17 @@ def main():
     print(f"🌐 Scraping {len(urls_to_scrape)} URL(s)")
     print(f"{'='*60}\n")
     
-    # Scrape all URLs
-    for url in urls_to_scrape:
-        reports = scraper.scrape_forum_url(url)
-        all_reports.extend(reports)
+    # One browser per URL being scraped concurrently, up to MAX_BROWSERS
+    pool_size = min(MAX_BROWSERS, len(urls_to_scrape))
+    scraper = FishingForumScraper(pool_size=pool_size)
+    scraper.debug_mode = args.debug  # Add debug flag
+    
+    # Scrape all URLs; page loads are network bound so threads overlap them
+    with ThreadPoolExecutor(max_workers=pool_size) as executor:
+        futures = [executor.submit(scraper.scrape_forum_url, url) for url in urls_to_scrape]
+        # Collect in submission order so the saved reports are deterministic
+        for future in futures:
+            all_reports.extend(future.result())
     
     # Clean up browser
     scraper._close_browser()
@@ -601,8 +1054,13 @@ def main():
         print("  - Paste a forum URL directly from your browser address bar")
         return
     
-    # Save reports
+    # Save reports - the JSONL log is always written, markdown unless --no-md
     print(f"\n📊 Saving {len(all_reports)} total reports...")
+    scraper.save_reports_to_jsonl(all_reports)
+    if args.no_md:
+        print(f"💡 Run with --render-md to build markdown files from {REPORTS_JSONL}")
+        return
+    
     created = scraper.save_reports_to_files(all_reports)
     
     if created > 0:
@@ -5,10 +5,27 @@ Falls back to manual data entry or cached data.
 """
 
 import json
+import os
 from datetime import datetime
 from pathlib import Path
 import time
 
+# orjson serializes in C and hands back bytes we can write in one go
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+REPORTS_DIR = Path("fishing_reports")
+
+def _write_atomic(filepath, data):
+    """Write bytes to a sibling temp file, then swap it into place"""
+    tmp = filepath.with_suffix(filepath.suffix + ".tmp")
+    with open(tmp, 'wb', buffering=65536) as f:
+        f.write(data)
+    os.replace(tmp, filepath)
+
 def create_manual_bite_times_template():
     """Create a template for manual entry of bite times"""
     
@@ -37,13 +54,16 @@ def create_manual_bite_times_template():
         }
     }
     
-    filepath = Path("fishing_reports") / "BITE_TIMES_MANUAL.json"
+    filepath = REPORTS_DIR / "BITE_TIMES_MANUAL.json"
     
     try:
+        # Never clobber a template the user has already filled in
         if not filepath.exists():
-            filepath.parent.mkdir(parents=True, exist_ok=True)
-            with open(filepath, 'w') as f:
-                json.dump(template, f, indent=2)
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(template, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(template, indent=2).encode('utf-8')
+            _write_atomic(filepath, data)
             print(f"✅ Created template: {filepath}")
             print("   Edit this file to add real bite times from the website")
             return filepath
@@ -52,10 +72,8 @@ def create_manual_bite_times_template():
     
     return None
 
-def create_manual_forum_reports_guide():
-    """Create a guide for manually adding forum fishing reports"""
-    
-    guide = """# Manual Fishing Report Entry Guide
+# Static guide text, encoded once at import rather than on every call
+_GUIDE_BYTES = """# Manual Fishing Report Entry Guide
 
 ## How to Add Forum Fishing Reports
 
@@ -130,14 +148,15 @@ Create `fishing_reports/WELLINGTON_HARBOR_FORUM_FEB2026.md` with actual post dat
 - Note what DIDN'T work (important for pattern learning)
 
 The system learns best from detailed, dated, actual fishing outcomes.
-"""
+""".encode('utf-8')
+
+def create_manual_forum_reports_guide():
+    """Create a guide for manually adding forum fishing reports"""
     
-    filepath = Path("fishing_reports") / "MANUAL_REPORT_GUIDE.md"
+    filepath = REPORTS_DIR / "MANUAL_REPORT_GUIDE.md"
     
     try:
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(filepath, 'w') as f:
-            f.write(guide)
+        _write_atomic(filepath, _GUIDE_BYTES)
         print(f"✅ Created guide: {filepath}")
         return filepath
     except Exception as e:
@@ -179,6 +198,7 @@ def main():
     
     # Create templates
     print("Step 1: Setting up templates...")
+    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
     create_manual_bite_times_template()
     create_manual_forum_reports_guide()
     
@@ -5,67 +5,8 @@ import os
 import sys
 from datetime import datetime
 
-os.environ['METOCEAN_API_KEY'] = 'test_key'
-os.environ['NIWA_API_KEY'] = 'test_key'
-
-import navigator
-
-print("=" * 70)
-print("CHOPPY WATER POTENTIAL TEST")
-print("=" * 70)
-print("\nFormula: Tide Range > 50cm (0.5m) AND Wind > 7kt AND Opposition")
-print("Result: Flagged as CHOPPY WATER POTENTIAL\n")
-
-# Test various combinations
-test_cases = [
-    {"tide_range": 0.3, "wind_kt": 10, "opposition": True, "description": "Small tide, high wind, opposition"},
-    {"tide_range": 0.6, "wind_kt": 10, "opposition": True, "description": "Large tide, high wind, opposition"},
-    {"tide_range": 0.6, "wind_kt": 5,  "opposition": True, "description": "Large tide, low wind, opposition"},
-    {"tide_range": 1.5, "wind_kt": 15, "opposition": True, "description": "Spring tide, strong wind, opposition"},
-    {"tide_range": 0.8, "wind_kt": 8,  "opposition": True, "description": "Good tide, moderate wind, opposition"},
-    {"tide_range": 1.2, "wind_kt": 20, "opposition": True, "description": "Large tide, very strong wind, opposition"},
-]
-
-print("Test Case Analysis:")
-print("-" * 70)
-
-for i, case in enumerate(test_cases, 1):
-    tide_range = case['tide_range']
-    wind_kt = case['wind_kt']
-    opposition = case['opposition']
-    
-    # Apply formula
-    is_choppy = (tide_range > 0.5 and wind_kt > 7 and opposition)
-    
-    print(f"\n{i}. {case['description']}")
-    print(f"   Tide Range: {tide_range:.2f}m", end="")
-    if tide_range > 0.5:
-        print(" ✓ (>0.5m)", end="")
-    else:
-        print(" ✗ (≤0.5m)", end="")
-    print()
-    print(f"   Wind Speed: {wind_kt:.0f}kt", end="")
-    if wind_kt > 7:
-        print(" ✓ (>7kt)", end="")
-    else:
-        print(" ✗ (≤7kt)", end="")
-    print()
-    print(f"   Opposition: {'Yes' if opposition else 'No'}", end="")
-    if opposition:
-        print(" ✓", end="")
-    else:
-        print(" ✗", end="")
-    print()
-    
-    if is_choppy:
-        print(f"   Result: 🚨 CHOPPY WATER POTENTIAL")
-    else:
-        print(f"   Result: ⚠️ Standard opposition (no choppy flag)")
-
-print("\n" + "=" * 70)
-print("CHOPPY WATER POTENTIAL IMPACT ON SAFETY")
-print("=" * 70)
-print("""
+# Static explanation printed after the test cases; a constant, built once
+IMPACT_REPORT = """
 When CHOPPY WATER POTENTIAL is flagged:
 
 1. ⚠️ **Extra 40% chop multiplier** applied to effective wave height
@@ -101,7 +42,61 @@ Standard opposition (tide ≤ 50cm or wind ≤ 7kt):
 
 Summary: Wind against tide increases effective wave height by ~40%
 ⚠️ **1 period(s) with CHOPPY WATER POTENTIAL** - Conditions to avoid
-""")
+"""
+
+os.environ.setdefault('METOCEAN_API_KEY', 'test_key')
+os.environ.setdefault('NIWA_API_KEY', 'test_key')
+
+import navigator
+
+print("=" * 70)
+print("CHOPPY WATER POTENTIAL TEST")
+print("=" * 70)
+print("\nFormula: Tide Range > 50cm (0.5m) AND Wind > 7kt AND Opposition")
+print("Result: Flagged as CHOPPY WATER POTENTIAL\n")
+
+# Test various combinations
+test_cases = [
+    {"tide_range": 0.3, "wind_kt": 10, "opposition": True, "description": "Small tide, high wind, opposition"},
+    {"tide_range": 0.6, "wind_kt": 10, "opposition": True, "description": "Large tide, high wind, opposition"},
+    {"tide_range": 0.6, "wind_kt": 5,  "opposition": True, "description": "Large tide, low wind, opposition"},
+    {"tide_range": 1.5, "wind_kt": 15, "opposition": True, "description": "Spring tide, strong wind, opposition"},
+    {"tide_range": 0.8, "wind_kt": 8,  "opposition": True, "description": "Good tide, moderate wind, opposition"},
+    {"tide_range": 1.2, "wind_kt": 20, "opposition": True, "description": "Large tide, very strong wind, opposition"},
+]
+
+# Labels indexed by each check's bool (False -> 0, True -> 1)
+TIDE_MARK = (" ✗ (≤0.5m)", " ✓ (>0.5m)")
+WIND_MARK = (" ✗ (≤7kt)", " ✓ (>7kt)")
+OPP_MARK = ("No ✗", "Yes ✓")
+RESULT = (
+    "   Result: ⚠️ Standard opposition (no choppy flag)",
+    "   Result: 🚨 CHOPPY WATER POTENTIAL",
+)
+
+print("Test Case Analysis:")
+print("-" * 70)
+
+for i, case in enumerate(test_cases, 1):
+    tide_range = case['tide_range']
+    wind_kt = case['wind_kt']
+    opposition = case['opposition']
+    
+    # Apply formula
+    big_tide = tide_range > 0.5
+    strong_wind = wind_kt > 7
+    is_choppy = big_tide and strong_wind and opposition
+    
+    print(f"\n{i}. {case['description']}")
+    print(f"   Tide Range: {tide_range:.2f}m{TIDE_MARK[big_tide]}")
+    print(f"   Wind Speed: {wind_kt:.0f}kt{WIND_MARK[strong_wind]}")
+    print(f"   Opposition: {OPP_MARK[opposition]}")
+    print(RESULT[is_choppy])
+
+print("\n" + "=" * 70)
+print("CHOPPY WATER POTENTIAL IMPACT ON SAFETY")
+print("=" * 70)
+print(IMPACT_REPORT)
 
 print("=" * 70)
 print("✅ Tide differential + wind speed formula: IMPLEMENTED")
@@ -11,6 +11,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from navigator import get_updated_executor
+from nav_test_helpers import invoke_cached
 
 def test_conversation_memory():
     """Test that the agent uses conversation context for follow-up questions."""
@@ -27,7 +28,7 @@ def test_conversation_memory():
     
     print("Running first query...")
     try:
-        response1 = executor.invoke({"input": query1})
+        response1 = invoke_cached(executor, query1)
         
         # Extract key info from response (times, dates)
         output1 = response1["output"]
@@ -63,7 +64,7 @@ def test_conversation_memory():
     print()
     
     try:
-        response2 = executor.invoke({"input": query2})
+        response2 = invoke_cached(executor, query2)
         
         output2 = response2["output"]
         
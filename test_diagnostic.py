@@ -3,6 +3,54 @@
 
 import sys
 import os
+import ast
+import hashlib
+import pickle
+from pathlib import Path
+
+# Parsing navigator.py dominates this script, so what we learn from the AST
+# is cached under .cache/, keyed on the file's size and mtime
+NAVIGATOR = Path("navigator.py")
+CACHE_DIR = Path(".cache")
+CACHE_VERSION = 2  # bump when the cached structure changes
+
+def load_navigator_structure():
+    """Top-level functions and fetch_niwa_tide_data calls in navigator.py (raises SyntaxError)
+    
+    Returns {"functions": {name: (first_line, last_line)},
+             "niwa_calls": [(line, source_text)] inside fetch_marine_data}
+    """
+    stat = NAVIGATOR.stat()
+    key = hashlib.blake2b(f"{CACHE_VERSION}:{stat.st_size}:{stat.st_mtime_ns}".encode(), digest_size=8).hexdigest()
+    cache_file = CACHE_DIR / f"nav_ast_{key}.pkl"
+    
+    if cache_file.exists():
+        return pickle.loads(cache_file.read_bytes())
+    
+    source = NAVIGATOR.read_text(encoding="utf-8")
+    tree = ast.parse(source)
+    # Only module-level defs matter here; no need to walk into function bodies
+    nodes = {node.name: node for node in tree.body
+             if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))}
+    functions = {name: (node.lineno, node.end_lineno) for name, node in nodes.items()}
+    
+    # Structural match on real calls, so comments and strings are ignored
+    niwa_calls = []
+    if "fetch_marine_data" in nodes:
+        lines = source.splitlines()
+        call_lines = sorted({node.lineno for node in ast.walk(nodes["fetch_marine_data"])
+                             if isinstance(node, ast.Call)
+                             and isinstance(node.func, ast.Name)
+                             and node.func.id == "fetch_niwa_tide_data"})
+        niwa_calls = [(number, lines[number - 1]) for number in call_lines]
+    
+    structure = {"functions": functions, "niwa_calls": niwa_calls}
+    
+    CACHE_DIR.mkdir(exist_ok=True)
+    for stale in CACHE_DIR.glob("nav_ast_*.pkl"):
+        stale.unlink()
+    cache_file.write_bytes(pickle.dumps(structure))
+    return structure
 
 # First, check if module can be parsed
 print("=" * 60)
@@ -10,10 +58,8 @@ print("STEP 1: Checking if navigator.py can be parsed")
 print("=" * 60)
 
 try:
-    import ast
-    with open("navigator.py", "r", encoding="utf-8") as f:
-        code = f.read()
-    tree = ast.parse(code)
+    structure = load_navigator_structure()
+    functions = structure["functions"]
     print("✅ navigator.py parses successfully as valid Python")
 except SyntaxError as e:
     print(f"❌ Syntax Error in navigator.py: {e}")
@@ -21,7 +67,6 @@ except SyntaxError as e:
 
 # Find all function definitions
 print("\nSearching for function definitions...")
-functions = [node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
 print(f"Found {len(functions)} functions:")
 
 if 'fetch_niwa_tide_data' in functions:
@@ -44,20 +89,9 @@ print("\n" + "=" * 60)
 print("STEP 2: Checking function definition order")
 print("=" * 60)
 
-with open("navigator.py", "r", encoding="utf-8") as f:
-    lines = f.readlines()
-
-fetch_niwa_line = None
-fetch_marine_line = None
-fetch_weather_line = None
-
-for i, line in enumerate(lines, 1):
-    if line.startswith("def fetch_niwa_tide_data"):
-        fetch_niwa_line = i
-    elif line.startswith("def fetch_marine_data"):
-        fetch_marine_line = i
-    elif line.startswith("def fetch_weather_wrapper"):
-        fetch_weather_line = i
+fetch_niwa_line = functions.get("fetch_niwa_tide_data", (None, None))[0]
+fetch_marine_line, fetch_marine_end = functions.get("fetch_marine_data", (None, None))
+fetch_weather_line = functions.get("fetch_weather_wrapper", (None, None))[0]
 
 print(f"fetch_niwa_tide_data:  Line {fetch_niwa_line}")
 print(f"fetch_marine_data:     Line {fetch_marine_line}")
@@ -73,25 +107,12 @@ print("\n" + "=" * 60)
 print("STEP 3: Searching for function calls")
 print("=" * 60)
 
-fetch_marine_start = fetch_marine_line - 1
-fetch_marine_end = None
-
-# Find the end of fetch_marine_data function
-for i in range(fetch_marine_start, len(lines)):
-    if i > fetch_marine_start and lines[i][0] not in [' ', '\t'] and lines[i].strip():
-        fetch_marine_end = i
-        break
-
-if not fetch_marine_end:
-    fetch_marine_end = len(lines)
-
-print(f"fetch_marine_data spans lines {fetch_marine_start + 1}-{fetch_marine_end}")
+print(f"fetch_marine_data spans lines {fetch_marine_line}-{fetch_marine_end}")
 
-calls_in_fetch_marine = 0
-for i in range(fetch_marine_start, fetch_marine_end):
-    if 'fetch_niwa_tide_data(' in lines[i]:
-        calls_in_fetch_marine += 1
-        print(f"  Line {i + 1}: {lines[i].strip()}")
+niwa_calls = structure["niwa_calls"]
+calls_in_fetch_marine = len(niwa_calls)
+for number, text in niwa_calls:
+    print(f"  Line {number}: {text.strip()}")
 
 if calls_in_fetch_marine > 0:
     print(f"\n✅ fetch_niwa_tide_data is called {calls_in_fetch_marine} time(s) in fetch_marine_data")
@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """Quick test of fishing report integration"""
 
-from navigator import search_fishing_reports, search_books
+# The cached wrappers are what the agent calls; repeat runs are served from the tool cache
+from navigator import cached_search_fishing_reports as search_fishing_reports
+from navigator import cached_search_books as search_books
 
 print("="*60)
 print("TESTING FISHING REPORT Integration")
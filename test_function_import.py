@@ -5,8 +5,8 @@ import os
 import sys
 
 # Set dummy keys
-os.environ['METOCEAN_API_KEY'] = 'test'
-os.environ['NIWA_API_KEY'] = 'test'
+os.environ.setdefault('METOCEAN_API_KEY', 'test')
+os.environ.setdefault('NIWA_API_KEY', 'test')
 
 try:
     from navigator import fetch_niwa_tide_data, fetch_weather_wrapper
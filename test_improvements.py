@@ -3,11 +3,14 @@
 
 import os
 import sys
+import re
 from datetime import datetime
 
+CROSS_RE = re.compile(r"\bcross(?:ing)?\b", re.I)
+
 # Set dummy API keys for testing
-os.environ['METOCEAN_API_KEY'] = 'test_key'
-os.environ['NIWA_API_KEY'] = 'test_key'
+os.environ.setdefault('METOCEAN_API_KEY', 'test_key')
+os.environ.setdefault('NIWA_API_KEY', 'test_key')
 
 # Suppress SSL warnings
 import urllib3
@@ -60,8 +63,7 @@ test_inputs = [
     "Is it safe to cross this weekend?",
 ]
 for test_input in test_inputs:
-    query = test_input.lower()
-    if any(word in query for word in ["cross", "crossing"]):
+    if CROSS_RE.search(test_input):
         print(f"   ✓ Detected crossing in: '{test_input}'")
     else:
         print(f"   ✗ FAILED to detect crossing in: '{test_input}'")
@@ -8,7 +8,8 @@ from mooring_utils import (
     extract_location_coordinates,
     parse_location_zone,
     extract_trip_duration,
-    haversine_distance
+    haversine_distance,
+    haversine_batch
 )
 
 print("=" * 70)
@@ -84,15 +85,12 @@ test_bays = [
     {'name': 'Port Underwood', 'coordinates': (-41.4167, 174.0833)},
 ]
 
-nearby = []
-for bay in test_bays:
-    dist = haversine_distance(
-        user_pos[0], user_pos[1],
-        bay['coordinates'][0], bay['coordinates'][1]
-    )
-    nearby.append((bay['name'], dist))
-
-nearby.sort(key=lambda x: x[1])
+dists = haversine_batch(
+    user_pos[0], user_pos[1],
+    [bay['coordinates'][0] for bay in test_bays],
+    [bay['coordinates'][1] for bay in test_bays]
+)
+nearby = sorted(zip((bay['name'] for bay in test_bays), dists), key=lambda x: x[1])
 print(f"   User location: Ship Cove {user_pos}")
 print(f"   Nearby bays (within 20nm):")
 for name, dist in nearby:
@@ -11,6 +11,27 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from navigator import get_updated_executor
+from nav_test_helpers import invoke_cached
+
+# Every marker the checks below look for, found in one pass over the output
+NEEDLES = ["DAY 1", "DAY 2", "DAY 3", "ITINERARY", "Friday", "Saturday", "Sunday",
+           "Monday", "Return", "Anchor"]
+DAY_NEEDLES = ["DAY 1", "DAY 2", "DAY 3", "Friday", "Saturday", "Sunday"]
+
+try:
+    import ahocorasick
+    NEEDLE_AUTOMATON = ahocorasick.Automaton()
+    for needle in NEEDLES:
+        NEEDLE_AUTOMATON.add_word(needle, needle)
+    NEEDLE_AUTOMATON.make_automaton()
+except ImportError:
+    NEEDLE_AUTOMATON = None
+
+def find_needles(output):
+    """Set of NEEDLES that occur anywhere in output"""
+    if NEEDLE_AUTOMATON is not None:
+        return {needle for _, needle in NEEDLE_AUTOMATON.iter(output)}
+    return {needle for needle in NEEDLES if needle in output}
 
 def test_multiday_trip():
     """Test that the agent correctly plans multi-day stays."""
@@ -33,31 +54,32 @@ def test_multiday_trip():
     print("  - Should NOT recommend same-day return\n")
     
     try:
-        response = executor.invoke({"input": query})
+        response = invoke_cached(executor, query)
         
         output = response["output"]
         print("Response:")
         print("-" * 80)
         
+        found = find_needles(output)
+        
         # Print key parts
-        if "DAY 1" in output or "ITINERARY" in output:
+        if "DAY 1" in found or "ITINERARY" in found:
             print("✅ Agent provided DAY-BY-DAY itinerary")
         else:
             print("❌ Agent did NOT provide day-by-day breakdown")
         
         # Check for multiple days
-        day_count = sum(1 for day in ["DAY 1", "DAY 2", "DAY 3", "Friday", "Saturday", "Sunday"] 
-                       if day in output)
+        day_count = sum(1 for day in DAY_NEEDLES if day in found)
         print(f"   Days mentioned: {day_count}")
         
         # Check for return dates that are NOT same-day
-        if "Return" in output and ("Sunday" in output or "Monday" in output):
+        if "Return" in found and ("Sunday" in found or "Monday" in found):
             print("✅ Agent recommended return on a different day (not same-day)")
         else:
             print("❓ Check output for return day recommendation")
         
         # Check for anchor day warnings
-        if "Anchor" in output or "Friday" in output or "Saturday" in output:
+        if "Anchor" in found or "Friday" in found or "Saturday" in found:
             print("✅ Agent mentioned anchoring conditions")
         else:
             print("❓ Check if anchoring is mentioned")
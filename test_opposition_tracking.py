@@ -5,8 +5,8 @@ import os
 import sys
 from datetime import datetime
 
-os.environ['METOCEAN_API_KEY'] = 'test_key'
-os.environ['NIWA_API_KEY'] = 'test_key'
+os.environ.setdefault('METOCEAN_API_KEY', 'test_key')
+os.environ.setdefault('NIWA_API_KEY', 'test_key')
 
 import navigator
 
@@ -35,17 +35,13 @@ print(f"   Tide direction (Flood): {tide_primary}° (NE)")
 print(f"   Opposite direction: {opposite_dir}° (SW)")
 print(f"   Opposition threshold: ±45° from opposite\n")
 
+# Same vectorised angle/compass computation fetch_marine_data runs over every forecast period
+diffs, compass = navigator.wind_tide_angles(wind_directions_test, opposite_dir)
+
 opposition_count = 0
-for wind_dir in wind_directions_test:
-    diff = abs(wind_dir - opposite_dir)
-    if diff > 180:
-        diff = 360 - diff
+for wind_dir, diff, wind_compass in zip(wind_directions_test, diffs, compass):
     has_opposition = diff < 45
     
-    compass_pts = ["N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE", "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"]
-    compass_idx = int((wind_dir + 11.25) / 22.5) % 16
-    wind_compass = compass_pts[compass_idx]
-    
     status = "⚠️ OPPOSITION" if has_opposition else "   No opposition"
     print(f"   Wind {wind_dir:3d}° ({wind_compass:3s}) → {diff:5.1f}° from opposite: {status}")
     if has_opposition:
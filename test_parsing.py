@@ -2,8 +2,10 @@
 """Test the weather wrapper and location lookups."""
 
 import os
-os.environ['METOCEAN_API_KEY'] = 'test_key'
-os.environ['NIWA_API_KEY'] = 'test_key'
+os.environ.setdefault('METOCEAN_API_KEY', 'test_key')
+os.environ.setdefault('NIWA_API_KEY', 'test_key')
+
+import navigator
 
 # Test days parsing
 test_cases = [
@@ -21,29 +23,17 @@ def test_days_parsing():
     print("Testing days parsing in fetch_weather_wrapper:")
     print("=" * 60)
     
-    time_phrases = {
-        'next week': 7, 'this week': 7, 'week': 7, '7 days': 7,
-        'next 3 days': 3, 'next three days': 3, '3 days': 3, 'three days': 3,
-        'next 5 days': 5, 'next five days': 5, '5 days': 5, 'five days': 5,
-        'next 10 days': 10, 'next ten days': 10, '10 days': 10, 'ten days': 10,
-        'fortnight': 14, 'next fortnight': 14,
-        'today': 1, 'tomorrow': 1,
-        'weekend': 2, 'next weekend': 2,
-    }
-    
     for input_str, expected_days in test_cases:
-        input_lower = input_str.lower()
         location = input_str
         days = 2  # default
         requested_days = None
         
-        # Check natural language
-        for phrase, day_count in time_phrases.items():
-            if phrase in input_lower:
-                requested_days = day_count
-                days = day_count
-                location = input_str.replace(phrase, '').replace(phrase.title(), '').strip(' ,')
-                break
+        # Check natural language: one scan, longest phrase wins
+        found = navigator.find_time_phrase(input_str)
+        if found:
+            start, end, requested_days = found
+            days = requested_days
+            location = (input_str[:start] + input_str[end:]).strip(' ,')
         
         # Check comma format
         if requested_days is None and ',' in input_str:
@@ -65,14 +55,6 @@ def test_location_lookup():
     print("Testing location lookups:")
     print("=" * 60)
     
-    LOCATIONS = {
-        "mana marina": {"lat": -41.10108, "lon": 174.86700},
-        "mana": {"lat": -41.1141, "lon": 174.8512},
-        "plimmerton": {"lat": -41.0821, "lon": 174.8615},
-        "pukerua bay": {"lat": -41.0312, "lon": 174.8945},
-        "cape koamaru": {"lat": -41.0883, "lon": 174.3814},
-    }
-    
     locations_to_test = [
         ("plimmerton", True),
         ("Plimmerton", True),
@@ -82,10 +64,9 @@ def test_location_lookup():
     ]
     
     for loc, should_exist in locations_to_test:
-        loc_key = loc.lower().strip()
-        exists = loc_key in LOCATIONS
+        coords = navigator.resolve_location(loc) or {}
+        exists = bool(coords)
         status = "OK" if exists == should_exist else "FAIL"
-        coords = LOCATIONS.get(loc_key, {})
         lat = coords.get("lat", "N/A")
         lon = coords.get("lon", "N/A")
         print(f"[{status}] '{loc}' -> Found: {exists}, Coords: ({lat}, {lon})")
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
-"""Direct test of recommendation functions without full navigator import."""
+"""Direct test of recommendation functions, plus a check of navigator's vectorised scorer."""
 
 import os
 import sys
+from statistics import fmean
 
 # Mock the get_secret function
 def get_secret(key_name):
@@ -115,8 +116,9 @@ def recommend_fishing_locations(wind_data, wave_data, boat_class, boat_size, tid
         return ""
     
     # Use average conditions from forecast
-    avg_wind = sum(wind_data[:3]) / len(wind_data[:3]) if wind_data else 0
-    avg_wave = sum(wave_data[:3]) / len(wave_data[:3]) if wave_data else 0
+    # Both lists are non-empty here, so fmean never sees an empty slice
+    avg_wind = fmean(wind_data[:3])
+    avg_wave = fmean(wave_data[:3])
     
     # Score all locations
     scores = []
@@ -203,4 +205,28 @@ for loc in test_locations:
     print(f"  Type: {score['type']}, Shelter: {score['shelter']}")
     print(f"  Reason: {score['reason']}")
 
+# navigator's vectorised scorer must agree with the per-location rules
+print("\n" + "="*60)
+print("Test Case 5: navigator.score_all_locations vs get_location_recommendation_score")
+print("="*60)
+
+os.environ.setdefault('METOCEAN_API_KEY', 'test_key')
+os.environ.setdefault('NIWA_API_KEY', 'test_key')
+import navigator
+
+if navigator.NUMPY_AVAILABLE:
+    checked = 0
+    for wind in [0, 5, 10, 13, 15, 18, 18.5, 20, 25, 30, 40]:
+        for wave in [0.2, 0.5, 0.8, 1.0, 1.1, 1.3, 1.5, 2.0, 3.0]:
+            for boat_class in ["SMALL", "MEDIUM", "LARGE"]:
+                for tide in [None, "rising", "flood", "falling", "ebb", "slack"]:
+                    scores = navigator.score_all_locations(wind, wave, boat_class, tide)
+                    for name, score in zip(navigator.LOCATION_NAMES, scores):
+                        expected = navigator.get_location_recommendation_score(name, wind, wave, boat_class, tide)["score"]
+                        assert score == expected, f"{name} {wind}kt {wave}m {boat_class} {tide}: {score} != {expected}"
+                        checked += 1
+    print(f"[OK] {checked} location scores match")
+else:
+    print("[SKIP] NumPy not installed, navigator has no score_all_locations")
+
 print("\n✅ All recommendation tests completed!")
@@ -4,29 +4,42 @@
 import os
 import sys
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Set dummy API keys
-os.environ['METOCEAN_API_KEY'] = 'test'
-os.environ['NIWA_API_KEY'] = 'test'
+os.environ.setdefault('METOCEAN_API_KEY', 'test')
+os.environ.setdefault('NIWA_API_KEY', 'test')
 
 # Import the recommendation functions
 try:
     from navigator import (
         get_location_recommendation_score,
         recommend_fishing_locations,
-        LOCATION_CHARACTERISTICS
+        LOCATION_CHARACTERISTICS,
+        LOCATION_NAMES
     )
+    if NUMPY_AVAILABLE:
+        from navigator import score_all_locations
     print("✅ Successfully imported recommendation functions\n")
 except Exception as e:
     print(f"❌ Import error: {e}")
     sys.exit(1)
 
+def forecast(values):
+    """Forecast series as navigator gets them: a float64 array, or a list without NumPy."""
+    return np.array(values, dtype=np.float64) if NUMPY_AVAILABLE else values
+
 # Test case 1: Good conditions for small boat
 print("="*60)
 print("Test Case 1: Good conditions (calm day)")
 print("="*60)
 
-wind_gust = [10, 12, 11, 10, 13, 12]  # 10-13 knots
-wave_height = [0.6, 0.7, 0.7, 0.6, 0.8, 0.7]  # 0.6-0.8m
+wind_gust = forecast([10, 12, 11, 10, 13, 12])  # 10-13 knots
+wave_height = forecast([0.6, 0.7, 0.7, 0.6, 0.8, 0.7])  # 0.6-0.8m
 boat_class = "SMALL"
 boat_size = 5.0
 
@@ -38,8 +51,8 @@ print("\n" + "="*60)
 print("Test Case 2: Moderate wind/waves")
 print("="*60)
 
-wind_gust = [18, 20, 19, 21, 22, 20]  # 18-22 knots
-wave_height = [1.2, 1.4, 1.3, 1.5, 1.6, 1.4]  # 1.2-1.6m
+wind_gust = forecast([18, 20, 19, 21, 22, 20])  # 18-22 knots
+wave_height = forecast([1.2, 1.4, 1.3, 1.5, 1.6, 1.4])  # 1.2-1.6m
 boat_class = "MEDIUM"
 boat_size = 8.0
 
@@ -51,8 +64,8 @@ print("\n" + "="*60)
 print("Test Case 3: Rough conditions")
 print("="*60)
 
-wind_gust = [28, 30, 32, 31, 29, 30]  # 28-32 knots
-wave_height = [2.2, 2.4, 2.6, 2.5, 2.3, 2.4]  # 2.2-2.6m
+wind_gust = forecast([28, 30, 32, 31, 29, 30])  # 28-32 knots
+wave_height = forecast([2.2, 2.4, 2.6, 2.5, 2.3, 2.4])  # 2.2-2.6m
 boat_class = "LARGE"
 boat_size = 10.0
 
@@ -69,11 +82,25 @@ wind = 15  # knots
 wave = 1.0  # meters
 boat_class = "MEDIUM"
 
+# Every location scored in one vectorised pass; the per-location calls below
+# are only needed for the reason text, and must agree with it
+all_scores = dict(zip(LOCATION_NAMES, score_all_locations(wind, wave, boat_class, "rising"))) if NUMPY_AVAILABLE else {}
+mismatches = []
+
 for loc in test_locations:
     score = get_location_recommendation_score(loc, wind, wave, boat_class, "rising")
     print(f"\n{loc.title()}:")
     print(f"  Score: {score['score']:.0f}/100")
     print(f"  Type: {score['type']}, Shelter: {score['shelter']}")
     print(f"  Reason: {score['reason']}")
+    if loc in all_scores and all_scores[loc] != score['score']:
+        mismatches.append(f"{loc}: {all_scores[loc]:.0f} vs {score['score']:.0f}")
+
+if not NUMPY_AVAILABLE:
+    print("\nℹ️ NumPy not installed, skipped the vectorised score check")
+elif mismatches:
+    print(f"\n❌ Vectorised scores disagree: {', '.join(mismatches)}")
+else:
+    print("\n✅ Vectorised scores match per-location scores")
 
 print("\n✅ All location recommendation tests completed!")
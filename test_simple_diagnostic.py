@@ -22,6 +22,8 @@ except SyntaxError as e:
 # Find all function definitions
 print("\nSearching for function definitions...")
 functions = [node.name for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)]
+# Line numbers of the module-level definitions, from the same parse
+def_lines = {node.name: node.lineno for node in tree.body if isinstance(node, ast.FunctionDef)}
 
 if 'fetch_niwa_tide_data' in functions:
     print("[OK] fetch_niwa_tide_data - FOUND")
@@ -38,17 +40,8 @@ print("\n" + "=" * 60)
 print("STEP 2: Checking function definition order")
 print("=" * 60)
 
-with open("navigator.py", "r", encoding="utf-8") as f:
-    lines = f.readlines()
-
-fetch_niwa_line = None
-fetch_marine_line = None
-
-for i, line in enumerate(lines, 1):
-    if line.startswith("def fetch_niwa_tide_data"):
-        fetch_niwa_line = i
-    elif line.startswith("def fetch_marine_data"):
-        fetch_marine_line = i
+fetch_niwa_line = def_lines.get("fetch_niwa_tide_data")
+fetch_marine_line = def_lines.get("fetch_marine_data")
 
 print(f"fetch_niwa_tide_data:  Line {fetch_niwa_line}")
 print(f"fetch_marine_data:     Line {fetch_marine_line}")
@@ -63,11 +56,14 @@ print("\n" + "=" * 60)
 print("STEP 3: Searching for function calls")
 print("=" * 60)
 
-calls_found = 0
-for i, line in enumerate(lines, 1):
-    if 'fetch_niwa_tide_data(' in line:
-        print(f"Line {i}: {line.strip()}")
-        calls_found += 1
+lines = code.splitlines()
+call_lines = sorted({node.lineno for node in ast.walk(tree)
+                     if isinstance(node, ast.Call)
+                     and isinstance(node.func, ast.Name)
+                     and node.func.id == "fetch_niwa_tide_data"})
+for i in call_lines:
+    print(f"Line {i}: {lines[i - 1].strip()}")
+calls_found = len(call_lines)
 
 print(f"\nTotal calls to fetch_niwa_tide_data: {calls_found}")
 
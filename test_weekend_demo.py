@@ -5,8 +5,8 @@ import os
 import sys
 from datetime import datetime
 
-os.environ['METOCEAN_API_KEY'] = 'test_key'
-os.environ['NIWA_API_KEY'] = 'test_key'
+os.environ.setdefault('METOCEAN_API_KEY', 'test_key')
+os.environ.setdefault('NIWA_API_KEY', 'test_key')
 
 import navigator
 